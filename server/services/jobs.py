@@ -9,8 +9,14 @@ import logging
 import os
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Mapping, Optional, Sequence
 
+try:  # pragma: no cover - executed in Docker container
+    from psycopg.types.json import Jsonb  # type: ignore
+except ImportError:  # pragma: no cover - executed locally
+    Jsonb = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,8 +52,21 @@ _JOB_COLUMNS = (
 
 _JOB_SELECT = ", ".join(_JOB_COLUMNS)
 
+_SELECT_JOBS_SQL = f"SELECT {_JOB_SELECT} FROM job_queue"
+_DEQUEUE_SQL = f"{_SELECT_JOBS_SQL} WHERE status = %s AND run_at <= now()"
+_DEQUEUE_ORDER_SQL = " ORDER BY priority DESC, run_at, id LIMIT 1"
+_GET_JOB_SQL = f"{_SELECT_JOBS_SQL} WHERE id = %s"
+_FIND_BY_PAYLOAD_SQL = (
+    f"{_SELECT_JOBS_SQL} WHERE job_type = %s AND payload_json = %s ORDER BY id DESC LIMIT 1"
+)
+_LIST_ORDER_SQL = " ORDER BY priority DESC, run_at, id"
+_ADMIN_ORDER_SQL = " ORDER BY priority DESC, id DESC"
+
+_TIMESTAMP_COLUMNS = ("run_at", "next_run_at", "created_at", "started_at", "finished_at")
+_TIMESTAMPTZ_OID = 1184
+
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Representation of a job queued in the database."""
 
@@ -92,6 +111,24 @@ def _ensure_optional_datetime(value: Any) -> dt.datetime | None:
     return _ensure_datetime(value)
 
 
+def _optional_utc(value: dt.datetime | None) -> dt.datetime | None:
+    return None if value is None else value.astimezone(UTC)
+
+
+def _cursor_tz_aware(cur) -> bool:
+    """Return whether ``cur`` reports every job timestamp column as ``timestamptz``.
+
+    psycopg hands such columns back as aware datetimes, so ``_row_to_job`` only
+    has to convert them to UTC rather than coerce naive or numeric values.
+    """
+
+    description = getattr(cur, "description", None)
+    if not description:
+        return False
+    type_codes = {column[0]: column[1] for column in description}
+    return all(type_codes.get(name) == _TIMESTAMPTZ_OID for name in _TIMESTAMP_COLUMNS)
+
+
 def _parse_payload(value: Any) -> Dict[str, Any]:
     if value is None:
         return {}
@@ -118,6 +155,67 @@ def _serialize_payload(payload: Dict[str, Any]) -> str:
         return json.dumps({}, sort_keys=True)
 
 
+def _payload_param(payload: Dict[str, Any]) -> Any:
+    """Return ``payload`` wrapped so the driver binds it as ``jsonb`` directly."""
+
+    if Jsonb is None:
+        return _serialize_payload(payload)
+    return Jsonb(payload, dumps=_serialize_payload)
+
+
+@lru_cache(maxsize=32)
+def _dequeue_sql(type_count: int) -> str:
+    sql = _DEQUEUE_SQL
+    if type_count:
+        placeholders = ", ".join(["%s"] * type_count)
+        sql += f" AND job_type IN ({placeholders})"
+    return sql + _DEQUEUE_ORDER_SQL
+
+
+@lru_cache(maxsize=None)
+def _list_sql(
+    order_sql: str,
+    *,
+    has_status: bool,
+    has_job_type: bool,
+    has_limit: bool,
+    has_offset: bool,
+) -> str:
+    filters: list[str] = []
+    if has_status:
+        filters.append("status = %s")
+    if has_job_type:
+        filters.append("job_type = %s")
+
+    sql = _SELECT_JOBS_SQL
+    if filters:
+        sql += " WHERE " + " AND ".join(filters)
+    sql += order_sql
+    if has_limit:
+        sql += " LIMIT %s"
+    if has_offset:
+        sql += " OFFSET %s"
+    return sql
+
+
+def _list_params(
+    status: str | None,
+    job_type: str | None,
+    limit: int | None,
+    offset: int | None,
+) -> tuple[Any, ...]:
+    params: list[Any] = []
+    if status is not None:
+        params.append(status)
+    if job_type is not None:
+        params.append(job_type)
+    if limit is not None:
+        params.append(int(limit))
+    if offset:
+        params.append(int(offset))
+    return tuple(params)
+
+
 def _compute_backoff_delay(job: Job, backoff_seconds: int | None = None) -> int:
     if backoff_seconds is not None:
         try:
@@ -134,17 +232,26 @@ def _compute_backoff_delay(job: Job, backoff_seconds: int | None = None) -> int:
     return clamped
 
 
-def _row_to_job(row: Any) -> Job:
+def _row_to_job(row: Any, *, tz_aware: bool = False) -> Job:
     if isinstance(row, dict):
         data = row
     else:
         data = dict(zip(_JOB_COLUMNS, row, strict=False))
 
-    created_at = _ensure_optional_datetime(data.get("created_at"))
-    run_at = _ensure_datetime(data.get("run_at"), default=created_at)
-    next_run_at = _ensure_optional_datetime(data.get("next_run_at"))
-    started_at = _ensure_optional_datetime(data.get("started_at"))
-    finished_at = _ensure_optional_datetime(data.get("finished_at"))
+    if tz_aware:
+        created_at = _optional_utc(data.get("created_at"))
+        run_at = _optional_utc(data.get("run_at"))
+        if run_at is None:
+            run_at = _ensure_datetime(None, default=created_at)
+        next_run_at = _optional_utc(data.get("next_run_at"))
+        started_at = _optional_utc(data.get("started_at"))
+        finished_at = _optional_utc(data.get("finished_at"))
+    else:
+        created_at = _ensure_optional_datetime(data.get("created_at"))
+        run_at = _ensure_datetime(data.get("run_at"), default=created_at)
+        next_run_at = _ensure_optional_datetime(data.get("next_run_at"))
+        started_at = _ensure_optional_datetime(data.get("started_at"))
+        finished_at = _ensure_optional_datetime(data.get("finished_at"))
 
     return Job(
         id=int(data.get("id")),
@@ -227,15 +334,13 @@ def enqueue_job(
             ),
         )
         row = cur.fetchone()
-    job = _row_to_job(row)
+        tz_aware = _cursor_tz_aware(cur)
+    job = _row_to_job(row, tz_aware=tz_aware)
     logger.info("Enqueued job %s (type=%s) with priority %s", job.id, job.job_type, job.priority)
     return job
 
 
 def dequeue_job(conn, job_types: Sequence[str] | None = None) -> Job | None:
-    filters = ["status = %s", "run_at <= now()"]
-    params: list[Any] = ["queued"]
-
     normalized_types: list[str] = []
     if job_types:
         for job_type in job_types:
@@ -245,26 +350,17 @@ def dequeue_job(conn, job_types: Sequence[str] | None = None) -> Job | None:
             if cleaned:
                 normalized_types.append(cleaned)
 
-    if normalized_types:
-        placeholders = ", ".join(["%s"] * len(normalized_types))
-        filters.append(f"job_type IN ({placeholders})")
-        params.extend(normalized_types)
-
-    sql = f"""
-        SELECT {_JOB_SELECT}
-        FROM job_queue
-    """
-    if filters:
-        sql += " WHERE " + " AND ".join(filters)
-    sql += " ORDER BY priority DESC, run_at, id LIMIT 1"
-
     with conn.cursor() as cur:
-        cur.execute(sql, tuple(params))
+        cur.execute(
+            _dequeue_sql(len(normalized_types)),
+            ("queued", *normalized_types),
+        )
         row = cur.fetchone()
+        tz_aware = _cursor_tz_aware(cur)
     if not row:
         return None
 
-    job = _row_to_job(row)
+    job = _row_to_job(row, tz_aware=tz_aware)
     with conn.cursor() as cur:
         cur.execute(
             "UPDATE job_queue SET status = %s, started_at = now() WHERE id = %s",
@@ -400,48 +496,30 @@ def list_jobs(
 ) -> list[Job]:
     """Return queued jobs ordered by priority and run time."""
 
-    params: list[Any] = []
-
-    sql = f"SELECT {_JOB_SELECT} FROM job_queue"
-    filters: list[str] = []
-
-    if status is not None:
-        filters.append("status = %s")
-        params.append(status)
-    if job_type is not None:
-        filters.append("job_type = %s")
-        params.append(job_type)
-
-    if filters:
-        sql += " WHERE " + " AND ".join(filters)
-
-    sql += " ORDER BY priority DESC, run_at, id"
-
-    if limit is not None:
-        sql += " LIMIT %s"
-        params.append(int(limit))
-
-    if offset:
-        sql += " OFFSET %s"
-        params.append(int(offset))
+    sql = _list_sql(
+        _LIST_ORDER_SQL,
+        has_status=status is not None,
+        has_job_type=job_type is not None,
+        has_limit=limit is not None,
+        has_offset=bool(offset),
+    )
 
     with conn.cursor() as cur:
-        cur.execute(sql, tuple(params))
+        cur.execute(sql, _list_params(status, job_type, limit, offset))
         rows = cur.fetchall()
+        tz_aware = _cursor_tz_aware(cur)
 
-    return [_row_to_job(row) for row in rows]
+    return [_row_to_job(row, tz_aware=tz_aware) for row in rows]
 
 
 def get_job(conn, job_id: int) -> Job | None:
     """Return a single job by identifier."""
 
     with conn.cursor() as cur:
-        cur.execute(
-            f"SELECT {_JOB_SELECT} FROM job_queue WHERE id = %s",
-            (job_id,),
-        )
+        cur.execute(_GET_JOB_SQL, (job_id,))
         row = cur.fetchone()
-    return _row_to_job(row) if row else None
+        tz_aware = _cursor_tz_aware(cur)
+    return _row_to_job(row, tz_aware=tz_aware) if row else None
 
 
 def find_job_by_payload(
@@ -452,21 +530,12 @@ def find_job_by_payload(
 ) -> Job | None:
     """Return the newest job matching the provided type and payload."""
 
-    serialized_payload = _serialize_payload(payload)
     with conn.cursor() as cur:
-        cur.execute(
-            f"""
-            SELECT {_JOB_SELECT}
-            FROM job_queue
-            WHERE job_type = %s AND payload_json = %s::jsonb
-            ORDER BY id DESC
-            LIMIT 1
-            """,
-            (job_type, serialized_payload),
-        )
+        cur.execute(_FIND_BY_PAYLOAD_SQL, (job_type, _payload_param(payload)))
         row = cur.fetchone()
+        tz_aware = _cursor_tz_aware(cur)
 
-    return _row_to_job(row) if row else None
+    return _row_to_job(row, tz_aware=tz_aware) if row else None
 
 
 def list_jobs_admin(
@@ -479,34 +548,20 @@ def list_jobs_admin(
 ) -> list[Job]:
     """Return jobs ordered by priority and id for administrative views."""
 
-    filters: list[str] = []
-    params: list[Any] = []
-
-    if status is not None:
-        filters.append("status = %s")
-        params.append(status)
-
-    if job_type is not None:
-        filters.append("job_type = %s")
-        params.append(job_type)
-
-    sql = f"SELECT {_JOB_SELECT} FROM job_queue"
-    if filters:
-        sql += " WHERE " + " AND ".join(filters)
-    sql += " ORDER BY priority DESC, id DESC"
-
-    if limit is not None:
-        sql += " LIMIT %s"
-        params.append(int(limit))
-    if offset:
-        sql += " OFFSET %s"
-        params.append(int(offset))
+    sql = _list_sql(
+        _ADMIN_ORDER_SQL,
+        has_status=status is not None,
+        has_job_type=job_type is not None,
+        has_limit=limit is not None,
+        has_offset=bool(offset),
+    )
 
     with conn.cursor() as cur:
-        cur.execute(sql, tuple(params))
+        cur.execute(sql, _list_params(status, job_type, limit, offset))
         rows = cur.fetchall()
+        tz_aware = _cursor_tz_aware(cur)
 
-    return [_row_to_job(row) for row in rows]
+    return [_row_to_job(row, tz_aware=tz_aware) for row in rows]
 
 
 __all__ = [
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import math
+import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Iterable, List, Sequence
 
 from sumy.nlp.tokenizers import Tokenizer
@@ -14,9 +16,19 @@ from sumy.summarizers.luhn import LuhnSummarizer
 
 from . import chunker
 
+try:  # pragma: no cover - optional native tokenizer
+    import blingfire  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - fall back to NLTK via sumy
+    blingfire = None  # type: ignore[assignment]
+
+# blingfire splits sentences and words differently from sumy's NLTK tokenizer,
+# so summaries only switch to it when this is set explicitly.
+FAST_TOKENIZER_ENV = "PLOW_FAST_TOKENIZER"
+
 logger = logging.getLogger(__name__)
 
 _SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_TERMINALS = frozenset(".!?")
 
 
 @dataclass
@@ -41,11 +53,44 @@ def _fallback_sentences(text: str, limit: int) -> List[str]:
     return results
 
 
+class _FastTokenizer:
+    """Sumy-compatible tokenizer backed by blingfire's native splitter."""
+
+    _WORD_PATTERN = Tokenizer._WORD_PATTERN
+
+    def __init__(self, language: str) -> None:
+        self._language = language
+
+    @property
+    def language(self) -> str:
+        return self._language
+
+    def to_sentences(self, paragraph: str) -> tuple[str, ...]:
+        sentences = blingfire.text_to_sentences(paragraph).split("\n")
+        return tuple(sentence.strip() for sentence in sentences if sentence.strip())
+
+    def to_words(self, sentence: str) -> tuple[str, ...]:
+        words = blingfire.text_to_words(sentence).split()
+        return tuple(word for word in words if self._WORD_PATTERN.search(word))
+
+
+def _fast_tokenizer_enabled() -> bool:
+    value = os.getenv(FAST_TOKENIZER_ENV, "").strip().lower()
+    return blingfire is not None and value in {"1", "true", "on", "yes"}
+
+
+@lru_cache(maxsize=None)
+def _get_tokenizer(language: str = "english", fast: bool = False):
+    if fast:
+        return _FastTokenizer(language)
+    return Tokenizer(language)
+
+
 def _summarize_chunk_text(text: str, desired_points: int) -> List[str]:
     if not text.strip():
         return []
 
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
+    parser = PlaintextParser.from_string(text, _get_tokenizer(fast=_fast_tokenizer_enabled()))
     summarizer = LuhnSummarizer()
     try:
         sentences = summarizer(parser.document, desired_points)
@@ -96,9 +141,9 @@ def _format_tldr(points: Sequence[str]) -> str:
 
 def _ensure_sentence(text: str) -> str:
     cleaned = text.strip()
-    if not cleaned.endswith(('.', '!', '?')):
-        cleaned = f"{cleaned}."
-    return cleaned
+    if cleaned and cleaned[-1] in _TERMINALS:
+        return cleaned
+    return f"{cleaned}."
 
 
 def _build_narrative(points: Sequence[str]) -> str:
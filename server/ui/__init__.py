@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import datetime as dt
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse
@@ -13,6 +15,13 @@ try:  # pragma: no cover - executed only when optional dependency missing
 except ModuleNotFoundError:  # pragma: no cover - optional dependency guard
     jinja2 = None
 
+try:  # pragma: no cover - executed in Docker container
+    import orjson  # type: ignore
+    from psycopg.types.json import set_json_loads  # type: ignore
+except ImportError:  # pragma: no cover - fall back to psycopg's json.loads
+    orjson = None
+    set_json_loads = None
+
 
 router = APIRouter(default_response_class=HTMLResponse)
 TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
@@ -49,26 +58,45 @@ def _db_conn():
     return app_module.db_conn()
 
 
-def _serialize_episode(row: Iterable[Any]) -> dict[str, Any]:
-    episode_id, title, published_at, tl_dr, narrative, claim_count = row
-    return {
-        "id": int(episode_id),
-        "title": title,
-        "published_at": published_at,
-        "tl_dr": tl_dr,
-        "narrative": narrative,
-        "claim_count": int(claim_count or 0),
-    }
+def _use_fast_json(cur) -> None:
+    """Decode ``json`` columns with orjson when it is available."""
+
+    if orjson is not None and set_json_loads is not None:
+        set_json_loads(orjson.loads, cur)
+
+
+def _with_published_label(episode: dict[str, Any]) -> dict[str, Any]:
+    """Add the display date for ``published_at``, which JSON carries as a string.
+
+    Formatting here rather than with ``to_char`` keeps the label independent of
+    the database's ``lc_time`` locale.
+    """
+
+    published_at = episode.get("published_at")
+    label = None
+    if published_at:
+        try:
+            label = dt.datetime.fromisoformat(published_at).strftime("%B %d, %Y")
+        except (TypeError, ValueError):
+            label = None
+    episode["published_label"] = label
+    return episode
 
 
 def _load_recent_episodes(limit: int = 12) -> list[dict[str, Any]]:
     with _db_conn() as conn:
         cur = conn.cursor()
+        _use_fast_json(cur)
         cur.execute(
             """
-            SELECT e.id, e.title, e.published_at,
-                   summary.tl_dr, summary.narrative,
-                   COALESCE(claim_totals.count, 0) AS claim_count
+            SELECT json_build_object(
+                'id', e.id,
+                'title', e.title,
+                'published_at', e.published_at,
+                'tl_dr', summary.tl_dr,
+                'narrative', summary.narrative,
+                'claim_count', COALESCE(claim_totals.count, 0)
+            ) AS payload
             FROM episode e
             LEFT JOIN LATERAL (
                 SELECT tl_dr, narrative
@@ -88,16 +116,25 @@ def _load_recent_episodes(limit: int = 12) -> list[dict[str, Any]]:
             (limit,),
         )
         rows = cur.fetchall()
-    return [_serialize_episode(row) for row in rows]
+    return [_with_published_label(row[0]) for row in rows]
 
 
 def _load_episode_detail(episode_id: int) -> dict[str, Any]:
     with _db_conn() as conn:
         cur = conn.cursor()
+        _use_fast_json(cur)
         cur.execute(
             """
-            SELECT e.id, e.title, e.published_at, e.show_notes_url, e.youtube_url, e.audio_url,
-                   summary.tl_dr, summary.narrative
+            SELECT json_build_object(
+                'id', e.id,
+                'title', e.title,
+                'published_at', e.published_at,
+                'show_notes_url', e.show_notes_url,
+                'youtube_url', e.youtube_url,
+                'audio_url', e.audio_url,
+                'tl_dr', summary.tl_dr,
+                'narrative', summary.narrative
+            ) AS payload
             FROM episode e
             LEFT JOIN LATERAL (
                 SELECT tl_dr, narrative
@@ -114,16 +151,7 @@ def _load_episode_detail(episode_id: int) -> dict[str, Any]:
         if not row:
             raise HTTPException(status_code=404, detail="Episode not found")
 
-        episode = {
-            "id": int(row[0]),
-            "title": row[1],
-            "published_at": row[2],
-            "show_notes_url": row[3],
-            "youtube_url": row[4],
-            "audio_url": row[5],
-            "tl_dr": row[6],
-            "narrative": row[7],
-        }
+        episode = _with_published_label(row[0])
 
         cur.execute(
             """
@@ -145,7 +173,7 @@ def _load_episode_detail(episode_id: int) -> dict[str, Any]:
         claim_rows = cur.fetchall()
 
         claim_ids = [int(row[0]) for row in claim_rows]
-        evidence_map: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        evidence_map: dict[int, list[dict[str, Any]]] = {}
         if claim_ids:
             cur.execute(
                 """
@@ -158,8 +186,9 @@ def _load_episode_detail(episode_id: int) -> dict[str, Any]:
                 """,
                 (claim_ids,),
             )
-            for claim_id, title, url, source_type, journal, year, stance, notes in cur.fetchall():
-                evidence_map[int(claim_id)].append(
+            # Rows arrive ordered by claim_id, so consecutive runs form each group.
+            evidence_map = {
+                int(claim_id): [
                     {
                         "title": title,
                         "url": url,
@@ -169,7 +198,10 @@ def _load_episode_detail(episode_id: int) -> dict[str, Any]:
                         "stance": stance,
                         "notes": notes,
                     }
-                )
+                    for _, title, url, source_type, journal, year, stance, notes in group
+                ]
+                for claim_id, group in groupby(cur.fetchall(), key=itemgetter(0))
+            }
 
     claims = []
     for claim_id, normalized_text, topic, domain, risk_level, grade, rationale in claim_rows:
@@ -8,15 +8,30 @@ in-memory substitute that understands the handful of SQL statements used in
 the API handlers and seed data.
 """
 
+import bisect
 import datetime as dt
-from dataclasses import dataclass
+import heapq
+from functools import lru_cache
+from itertools import accumulate
 import json
+import numbers
+from operator import contains, eq, itemgetter
 import re
-from typing import Any, Dict, List, Sequence, Tuple
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
 
 
 NOW_SENTINEL = object()
 
+# Scanners yield only quoted literals ('' escapes a quote; an unterminated
+# literal runs to the end) and the structural characters each parser acts on;
+# everything else is skipped inside the regex engine.
+_TUPLE_SCAN_RE = re.compile(r"'[^']*(?:''[^']*)*'?|[();]")
+_VALUE_SCAN_RE = re.compile(r"'[^']*(?:''[^']*)*'?|[(),]")
+
+# A single VALUES tuple made only of placeholders, optionally cast (``%s::jsonb``).
+_PLACEHOLDER_VALUES_RE = re.compile(r"\s*\(\s*%s(?:::\w+)?(?:\s*,\s*%s(?:::\w+)?)*\s*\)\s*")
+
 
 def _as_datetime(value: Any) -> dt.datetime:
     if isinstance(value, dt.datetime):
@@ -29,24 +44,140 @@ def _as_datetime(value: Any) -> dt.datetime:
 
 
 def _normalize_sql(sql: str) -> str:
-    return " ".join(sql.strip().lower().split())
+    # split() already discards leading/trailing whitespace.
+    return " ".join(sql.lower().split())
+
+
+@lru_cache(maxsize=1024)
+def _compile_ilike(pattern: str) -> "re.Pattern[str]":
+    # re.escape leaves % and _ alone, so they can be swapped for their regex
+    # equivalents afterwards. DOTALL because % also spans newlines in Postgres.
+    regex = re.escape(pattern).replace("%", ".*").replace("_", ".")
+    return re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+
+# How a literal needle is tested against a lower-cased value, by where the
+# pattern has its % wildcards.
+_LITERAL_TESTS: Dict[str, Callable[[str, str], bool]] = {
+    "contains": contains,
+    "prefix": str.startswith,
+    "suffix": str.endswith,
+    "equals": eq,
+}
+
+
+@lru_cache(maxsize=1024)
+def _ilike_literal(pattern: str) -> Tuple[Callable[[str, str], bool], str] | None:
+    """``(test, lower-cased needle)`` when ``pattern`` only has ``%`` at its ends.
+
+    Search boxes send ``%term%``; a plain substring test on ``value.lower()``
+    (what Postgres ILIKE compares) beats running a regex for those.
+    """
+
+    needle = pattern.strip("%")
+    if not needle or "%" in needle or "_" in needle:
+        return None
+    leading, trailing = pattern.startswith("%"), pattern.endswith("%")
+    if leading and trailing:
+        shape = "contains"
+    elif leading:
+        shape = "suffix"
+    elif trailing:
+        shape = "prefix"
+    else:
+        shape = "equals"
+    return _LITERAL_TESTS[shape], needle.lower()
 
 
 def _ilike_match(value: str, pattern: str) -> bool:
     if value is None or pattern is None:
         return False
+    literal = _ilike_literal(pattern)
+    if literal is not None:
+        test, needle = literal
+        return test(value.lower(), needle)
+    return _compile_ilike(pattern).fullmatch(value) is not None
+
+
+@lru_cache(maxsize=256)
+def _compile_ilike_batch(pattern: str) -> "re.Pattern[str]":
+    # Same translation as _compile_ilike, but wildcards stop at NUL and the
+    # match is anchored to NUL boundaries so it covers exactly one joined value.
+    body = re.escape(pattern).replace("%", "[^\x00]*").replace("_", "[^\x00]")
+    return re.compile(r"(?<![^\x00])" + body + r"(?![^\x00])", re.IGNORECASE)
+
+
+def _ilike_indices(values: Sequence[str], pattern: str) -> List[int]:
+    """Ascending positions of the ``values`` that match ILIKE ``pattern``.
+
+    Literal patterns with ``%`` only at the ends take the string test from
+    _ilike_literal. Otherwise the values are joined with NUL (which Postgres
+    text cannot contain) and scanned once; match offsets map back to values
+    through the running value offsets.
+    """
+
+    literal = _ilike_literal(pattern)
+    if literal is not None:
+        test, needle = literal
+        return [index for index, value in enumerate(values) if test(value.lower(), needle)]
+    offsets = list(accumulate((len(value) + 1 for value in values), initial=0))
+    joined = "\x00".join(values)
+    return [
+        bisect.bisect_right(offsets, match.start()) - 1
+        for match in _compile_ilike_batch(pattern).finditer(joined)
+    ]
+
+
+def _ilike_filter(
+    rows: Sequence[Dict[str, Any]], column: str, pattern: str | None
+) -> List[Dict[str, Any]]:
+    """Rows whose non-NULL ``column`` matches ILIKE ``pattern``, in row order."""
+
+    if pattern is None:
+        return []
+    candidates = [row for row in rows if row.get(column) is not None]
+    if not candidates:
+        return []
+    return [
+        candidates[index]
+        for index in _ilike_indices([row[column] for row in candidates], pattern)
+    ]
+
+
+def _json_param(value: Any) -> Any:
+    # psycopg's Json/Jsonb adapters keep the wrapped object on ``obj``.
+    value = getattr(value, "obj", value)
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return {}
+    return value
+
+
+def _canonical_payload(value: Any) -> Any:
+    # Values that compare equal must map to the same canonical form: 1, 1.0
+    # and True all become 1, and dict keys become strings so they sort.
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else str(_canonical_payload(key)): _canonical_payload(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical_payload(item) for item in value]
+    if isinstance(value, numbers.Number) and not isinstance(value, complex):
+        try:
+            integral = int(value)
+        except (OverflowError, ValueError):
+            return value
+        return integral if integral == value else float(value)
+    return value
 
-    regex_parts: List[str] = []
-    for ch in pattern:
-        if ch == "%":
-            regex_parts.append(".*")
-        elif ch == "_":
-            regex_parts.append(".")
-        else:
-            regex_parts.append(re.escape(ch))
 
-    regex = "".join(regex_parts)
-    return re.fullmatch(regex, value, re.IGNORECASE) is not None
+def _payload_signature(value: Any) -> str:
+    """Bucket key for a payload; payloads that compare equal share a key."""
+
+    return json.dumps(_canonical_payload(value), sort_keys=True, default=str)
 
 
 def _coerce_sortable_date(value: Any) -> float:
@@ -64,146 +195,682 @@ def _coerce_sortable_date(value: Any) -> float:
     return 0.0
 
 
+# Clauses the job listing handlers recognise, as bit flags that
+# _job_clauses computes once per statement.
+(
+    _WHERE_ID,
+    _WHERE_STATUS_DUE,
+    _WHERE_STATUS,
+    _JOB_TYPE_IN,
+    _JOB_TYPE_EQ,
+    _WHERE_JOB_TYPE,
+    _AND_JOB_TYPE,
+    _WHERE_FINGERPRINT,
+    _AND_FINGERPRINT,
+    _ORDER_PRIORITY_RUN_AT,
+    _ORDER_PRIORITY_ID_DESC,
+    _ORDER_PRIORITY,
+    _ORDER_ID_DESC,
+    _LIMIT_PARAM,
+    _LIMIT_ONE,
+    _OFFSET_PARAM,
+    _PAYLOAD_JSON,
+    _PAYLOAD_JSONB_EQ,
+    _PAYLOAD_EQ,
+) = (1 << bit for bit in range(19))
+
+_JOB_CLAUSES: Tuple[Tuple[int, str], ...] = (
+    (_WHERE_ID, "where id = %s"),
+    (_WHERE_STATUS_DUE, "where status = %s and run_at <= now()"),
+    (_WHERE_STATUS, "where status = %s"),
+    (_JOB_TYPE_IN, "job_type in ("),
+    (_JOB_TYPE_EQ, "job_type = %s"),
+    (_WHERE_JOB_TYPE, "where job_type = %s"),
+    (_AND_JOB_TYPE, "and job_type = %s"),
+    (_WHERE_FINGERPRINT, "where fingerprint = %s"),
+    (_AND_FINGERPRINT, "and fingerprint = %s"),
+    (_ORDER_PRIORITY_RUN_AT, "order by priority desc, run_at, id"),
+    (_ORDER_PRIORITY_ID_DESC, "order by priority desc, id desc"),
+    (_ORDER_PRIORITY, "order by priority desc"),
+    (_ORDER_ID_DESC, "order by id desc"),
+    (_LIMIT_PARAM, "limit %s"),
+    (_LIMIT_ONE, "limit 1"),
+    (_OFFSET_PARAM, "offset %s"),
+    (_PAYLOAD_JSON, "payload_json"),
+)
+
+
+@lru_cache(maxsize=64)
+def _job_clauses(normalized: str) -> int:
+    mask = 0
+    for flag, text in _JOB_CLAUSES:
+        if text in normalized:
+            mask |= flag
+    # The payload filter names whichever payload column the statement uses.
+    payload_key = "payload_json" if mask & _PAYLOAD_JSON else "payload"
+    if f"{payload_key}::jsonb = %s::jsonb" in normalized:
+        mask |= _PAYLOAD_JSONB_EQ
+    if f"{payload_key} = %s" in normalized:
+        mask |= _PAYLOAD_EQ
+    return mask
+
+
+@lru_cache(maxsize=64)
+def _in_list_size(normalized: str, opener: str) -> int:
+    """Number of placeholders in the ``IN (...)`` list that starts with ``opener``."""
+
+    return normalized.split(opener, 1)[1].split(")", 1)[0].count("%s")
+
+
+@lru_cache(maxsize=256)
+def _row_getter(columns: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    if len(columns) == 1:
+        # A one-column itemgetter returns the bare value rather than a 1-tuple.
+        (column,) = columns
+        return lambda row: (row[column],)
+    return itemgetter(*columns)
+
+
+def _project(rows: Sequence[Dict[str, Any]], columns: Tuple[str, ...]) -> List[Tuple[Any, ...]]:
+    """Project ``rows`` onto ``columns``; missing columns read as NULL."""
+
+    try:
+        return list(map(_row_getter(columns), rows))
+    except KeyError:
+        # Rows appended straight to ``tables`` may lack columns the insert
+        # path would have defaulted.
+        return [tuple(map(row.get, columns)) for row in rows]
+
+
+def _pick(row: Dict[str, Any], columns: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """``row`` projected onto ``columns``; a missing column reads as NULL."""
+
+    try:
+        return _row_getter(columns)(row)
+    except KeyError:
+        return tuple(map(row.get, columns))
+
+
+_GRADE_COLUMNS = ("grade", "rationale", "rubric_version", "created_at")
+_GRADE_PAIR = ("grade", "rationale")
+_NO_GRADE = (None, None, None, None)
+
+_CHUNK_COLUMNS = (
+    "id",
+    "transcript_id",
+    "chunk_index",
+    "token_start",
+    "token_end",
+    "token_count",
+    "text",
+    "key_points",
+    "source_hash",
+)
+
+
+def _claim_search_texts(claim: Dict[str, Any]) -> Tuple[str, str, str]:
+    """The columns the claim search ILIKEs, with NULL read as empty text."""
+
+    return (
+        claim.get("raw_text") or "",
+        claim.get("normalized_text") or "",
+        claim.get("topic") or "",
+    )
+
+
+def _chunk_position(row: Dict[str, Any]) -> Any:
+    return row.get("chunk_index", 0)
+
+
+def _outline_position(row: Dict[str, Any]) -> Tuple[bool, Any, Any]:
+    """``ORDER BY start_ms NULLS LAST, id`` for outline rows."""
+
+    start_ms = row.get("start_ms")
+    return (start_ms is None, start_ms if start_ms is not None else 0, row.get("id", 0))
+
+
+def _transcript_rank(row: Dict[str, Any]) -> Tuple[bool, Any, Any]:
+    """``ORDER BY word_count DESC NULLS LAST, id DESC`` for transcript rows."""
+
+    return (row.get("word_count") is None, -(row.get("word_count") or 0), -row.get("id", 0))
+
+
+# Index buckets kept sorted on insert (bisect.insort is stable for ties), so
+# the listings that read them need no sort.
+_SORTED_BUCKETS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "episode_outline": _outline_position,
+    "transcript_chunk": _chunk_position,
+}
+
+# Constant column defaults per table, laid down before an inserted row's own
+# values. Defaults that depend on other columns (next_run_at, created_at, ...)
+# are filled in by _insert_row.
+_INSERT_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "claim_grade": {"rubric_version": "v1", "graded_by": "auto-grader"},
+    "job": {
+        "status": "queued",
+        "priority": 0,
+        "fingerprint": None,
+        "run_at": None,
+        "attempts": 0,
+        "max_attempts": 3,
+        "error": None,
+        "last_error": None,
+        "result": None,
+        "started_at": None,
+        "finished_at": None,
+    },
+    "job_queue": {
+        "status": "queued",
+        "run_at": None,
+        "error": None,
+        "started_at": None,
+        "finished_at": None,
+    },
+    "transcript_chunk": {"key_points": None, "source_hash": None},
+}
+
+# job_queue columns mirrored from a job insert, and the job column each one
+# copies; every source has been defaulted by the time the mirror is built.
+_JOB_QUEUE_MIRROR_COLUMNS, _JOB_MIRROR_SOURCES = zip(
+    ("id", "id"),
+    ("job_type", "job_type"),
+    ("payload_json", "payload"),
+    ("payload", "payload"),
+    ("status", "status"),
+    ("priority", "priority"),
+    ("run_at", "run_at"),
+    ("next_run_at", "next_run_at"),
+    ("attempts", "attempts"),
+    ("max_attempts", "max_attempts"),
+    ("error", "error"),
+    ("last_error", "last_error"),
+    ("created_at", "created_at"),
+    ("started_at", "started_at"),
+    ("finished_at", "finished_at"),
+)
+
+_OUTLINE_COLUMNS = ("start_ms", "end_ms", "heading", "bullet_points")
+
+
+@lru_cache(maxsize=1024)
+def _run_at_key(value: Any) -> float:
+    """Sort position of a ``run_at`` value; unscheduled jobs sort last.
+
+    Cached per value: queues hold many jobs sharing a handful of timestamps.
+    """
+
+    if value is None:
+        return float("inf")
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float("inf")
+
+
+# Job sort keys. Module-level so the handlers pass the same function object
+# every call rather than building a closure per query.
+def _row_id(row: Dict[str, Any]) -> Any:
+    return row.get("id", 0)
+
+
+def _queue_run_order(row: Dict[str, Any]) -> Tuple[int, float, Any]:
+    """``ORDER BY priority DESC, run_at, id`` for job_queue rows."""
+
+    return (-int(row.get("priority", 0) or 0), _run_at_key(row.get("run_at")), row.get("id", 0))
+
+
+def _queue_admin_order(row: Dict[str, Any]) -> Tuple[int, Any]:
+    """``ORDER BY priority DESC, id DESC`` for job_queue rows."""
+
+    return (-int(row.get("priority", 0) or 0), -row.get("id", 0))
+
+
+def _job_priority_order(row: Dict[str, Any]) -> Tuple[bool, int, Any]:
+    """``ORDER BY priority DESC, id DESC`` for job rows; blank priorities sort last."""
+
+    return (row.get("priority") in (None, ""), -int(row.get("priority") or 0), -row.get("id", 0))
+
+
+def _sorted_head(
+    rows: List[Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Any],
+    limit: int | None,
+    *,
+    reverse: bool = False,
+) -> List[Dict[str, Any]]:
+    """``sorted(rows, key=key, reverse=reverse)[:limit]``, using a heap for small limits."""
+
+    if limit is not None and limit < len(rows) // 4:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(limit, rows, key=key)
+    rows.sort(key=key, reverse=reverse)
+    return rows if limit is None else rows[:limit]
+
+
 def _split_value_tuples(values_part: str) -> List[str]:
     tuples: List[str] = []
     depth = 0
-    start = None
-    in_string = False
-    escaped = False
-
-    for idx, ch in enumerate(values_part):
-        if ch == "'" and not escaped:
-            in_string = not in_string
-        if ch == "\\" and not escaped:
-            escaped = True
-        else:
-            escaped = False
-
-        if in_string:
-            continue
+    start = 0
 
-        if ch == "(":
+    for match in _TUPLE_SCAN_RE.finditer(values_part):
+        token = match.group()
+        if token == "(":
             if depth == 0:
-                start = idx
+                start = match.start()
             depth += 1
-        elif ch == ")":
+        elif token == ")":
             depth -= 1
-            if depth == 0 and start is not None:
-                tuples.append(values_part[start : idx + 1])
-        elif ch == ";" and depth == 0:
+            if depth == 0:
+                tuples.append(values_part[start : match.end()])
+        elif token == ";" and depth == 0:
             break
 
     return tuples
 
 
+# Classifies one VALUES token; the matching group (``lastindex``) picks the
+# conversion: 1 NULL, 2 now(), 3 quoted literal, 4 integer, 5 anything else.
+_VALUE_RE = re.compile(
+    r"\s*(?:(null)|(now\(\))|'(.*)'|([+-]?\d+)|(.*?))\s*\Z",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def _parse_value(token: str) -> Any:
-    token = token.strip()
-    if not token:
-        return None
-    lowered = token.lower()
-    if lowered == "null":
-        return None
-    if lowered == "now()":
+    match = _VALUE_RE.match(token)
+    kind = match.lastindex
+    if kind == 5:
+        return match.group(5) or None
+    if kind == 3:
+        return match.group(3).replace("''", "'")
+    if kind == 4:
+        return int(match.group(4))
+    if kind == 2:
         return NOW_SENTINEL
-    if token.startswith("'") and token.endswith("'"):
-        return token[1:-1].replace("''", "'")
-    try:
-        return int(token)
-    except ValueError:
-        return token
+    return None
 
 
 def _parse_tuple(tuple_str: str) -> List[Any]:
     assert tuple_str.startswith("(") and tuple_str.endswith(")")
+    inner = tuple_str[1:-1]
+    if "'" not in inner:
+        # No literals to protect: a plain split is enough (now() has no commas).
+        return [_parse_value(token) for token in inner.split(",")] if inner else []
+
     values: List[str] = []
-    current: List[str] = []
-    in_string = False
-    escaped = False
-
-    for ch in tuple_str[1:-1]:
-        if ch == "'" and not escaped:
-            in_string = not in_string
-            current.append(ch)
-        elif ch == "," and not in_string:
-            values.append("".join(current).strip())
-            current = []
-        else:
-            current.append(ch)
+    depth = 0
+    start = 0
 
-        if ch == "\\" and not escaped:
-            escaped = True
-        else:
-            escaped = False
+    for match in _VALUE_SCAN_RE.finditer(inner):
+        token = match.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif token == "," and depth == 0:
+            values.append(inner[start : match.start()].strip())
+            start = match.end()
 
-    if current:
-        values.append("".join(current).strip())
+    if inner[start:]:
+        values.append(inner[start:].strip())
 
     return [_parse_value(token) for token in values]
 
 
-def parse_insert(sql: str) -> Tuple[str, List[Dict[str, Any]]]:
+_INSERT_INTO_RE = re.compile(r"\s*insert\s+into\s+", re.IGNORECASE)
+
+
+def _split_insert(sql: str) -> Tuple[str, List[str], str]:
     statement = sql.strip().rstrip(";")
-    upper = statement.upper()
-    if not upper.startswith("INSERT INTO"):
+    match = _INSERT_INTO_RE.match(statement)
+    if match is None:
         raise ValueError(f"Unsupported SQL: {sql}")
 
     before_values, values_part = statement.split("VALUES", 1)
-    table_section = before_values[len("INSERT INTO") :].strip()
+    table_section = before_values[match.end() :].strip()
     table_name, column_part = table_section.split("(", 1)
-    table = table_name.strip()
-    columns = [col.strip() for col in column_part.rstrip(") ").split(",")]
+    table = sys.intern(table_name.strip())
+    # Interned so every row dict shares the same key objects as the literal
+    # column names the handlers look up.
+    columns = [sys.intern(col.strip()) for col in column_part.rstrip(") ").split(",")]
+    return table, columns, values_part
 
-    rows: List[Dict[str, Any]] = []
-    for tuple_str in _split_value_tuples(values_part):
-        parsed_values = _parse_tuple(tuple_str)
-        row = {col: val for col, val in zip(columns, parsed_values)}
-        rows.append(row)
 
-    return table, rows
+_RETURNING_RE = re.compile(r"\breturning\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _split_returning(sql: str) -> Tuple[str, Tuple[str, ...]]:
+    """Split ``INSERT ... RETURNING a, b`` into the statement and returned columns."""
+
+    match = _RETURNING_RE.search(sql)
+    if match is None:
+        return sql, ()
+    returning_part = sql[match.end() :].strip().rstrip(";")
+    columns = tuple(col.strip() for col in returning_part.split(",") if col.strip())
+    return sql[: match.start()].strip(), columns
+
+
+@lru_cache(maxsize=256)
+def _select_columns(normalized: str) -> Tuple[str, ...]:
+    """Column names of a normalized ``SELECT a, b FROM ...`` statement."""
+
+    select_clause, _, _ = normalized.partition(" from ")
+    return tuple(
+        column.strip()
+        for column in select_clause[len("select ") :].split(",")
+        if column.strip()
+    )
+
+
+_PUBMED_COALESCE_RE = re.compile(r"pubmed_id\s*=\s*coalesce")
+
+
+@lru_cache(maxsize=32)
+def _coalesced_identifier(normalized: str) -> str:
+    """The identifier column an ``UPDATE evidence_source`` fills via COALESCE."""
+
+    return "pubmed_id" if _PUBMED_COALESCE_RE.search(normalized) else "doi"
+
+
+@lru_cache(maxsize=256)
+def _placeholder_insert(sql: str) -> Tuple[str, Tuple[str, ...]] | None:
+    """Return ``(table, columns)`` when the single VALUES tuple is all placeholders."""
+
+    table, columns, values_part = _split_insert(sql)
+    if _PLACEHOLDER_VALUES_RE.fullmatch(values_part) is None:
+        return None
+    return table, tuple(columns)
+
+
+# Per VALUES row: the parsed ``(column, value)`` pairs plus, in order, the
+# columns whose value is a ``%s`` placeholder to be filled from params.
+_RowTemplate = Tuple[Tuple[Tuple[str, Any], ...], Tuple[str, ...]]
+
+
+def _row_template(pairs: Sequence[Tuple[str, Any]]) -> _RowTemplate:
+    slots = tuple(col for col, value in pairs if isinstance(value, str) and "%s" in value)
+    return tuple(pairs), slots
+
+
+@lru_cache(maxsize=256)
+def _insert_template(sql: str) -> Tuple[str, Tuple[_RowTemplate, ...]]:
+    """Parse ``sql`` once into immutable row templates."""
+
+    table, columns, values_part = _split_insert(sql)
+
+    if _PLACEHOLDER_VALUES_RE.fullmatch(values_part):
+        tokens = values_part.strip()[1:-1].split(",")
+        return table, (_row_template([(col, token.strip()) for col, token in zip(columns, tokens)]),)
+
+    templates = tuple(
+        _row_template(list(zip(columns, _parse_tuple(tuple_str))))
+        for tuple_str in _split_value_tuples(values_part)
+    )
+    return table, templates
+
+
+def parse_insert(sql: str) -> Tuple[str, List[Dict[str, Any]]]:
+    table, templates = _insert_template(sql)
+    return table, [dict(pairs) for pairs, _ in templates]
+
+
+class _Plan:
+    """Routing decision for one SQL string, computed on first sight."""
+
+    __slots__ = ("sql", "stripped", "normalized", "handler")
+
+    def __init__(self, sql: str, stripped: str, normalized: str, handler: "_Handler") -> None:
+        self.sql = sql
+        self.stripped = stripped
+        self.normalized = normalized
+        self.handler = handler
+
+
+_Handler = Callable[["FakeDatabase", _Plan, Sequence[Any]], List[Tuple[Any, ...]]]
+
+# Secondary hash indexes kept per table; every table also gets an ``id`` index.
+_INDEXED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "claim": ("episode_id", "topic"),
+    "claim_evidence": ("claim_id", "evidence_id"),
+    "claim_grade": ("claim_id",),
+    "episode_outline": ("episode_id",),
+    "episode_summary": ("episode_id",),
+    "evidence_source": ("pubmed_id", "doi"),
+    "transcript": ("episode_id",),
+    "transcript_chunk": ("transcript_id",),
+}
+
+# The application issues a small, fixed set of SQL templates, so routing is
+# resolved once per distinct string and reused for every later execute().
+_PLAN_CACHE: Dict[str, _Plan] = {}
+
+
+def _plan_statement(sql: str) -> _Plan:
+    stripped = sql.strip()
+    normalized = _normalize_sql(stripped)
+    handler = FakeDatabase._route(normalized) or FakeDatabase._exec_unsupported
+    plan = _Plan(sql, stripped, normalized, handler)
+    _PLAN_CACHE[sql] = plan
+    return plan
+
+
+# Statement routing. ``_route`` checks these in order: substring-only routes
+# for any statement, whole-statement matches, then prefix routes bucketed by
+# their leading keyword so a statement only walks the routes it could match.
+_ANY_VERB_ROUTES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("from episode where id = %s",), "_exec_episode_title"),
+    (("from episode_summary", "limit 1"), "_exec_latest_summary"),
+)
+
+_EXACT_ROUTES: Dict[str, str] = {
+    "select id, episode_id from claim order by id": "_exec_claim_ids",
+}
+
+_JOB_SELECT_PREFIXES = (
+    "select id, job_type, payload, status, priority, run_at",
+    "select id, job_type, payload_json, status, priority, run_at",
+)
+
+_ROUTES: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    (
+        "select start_ms, end_ms, heading, bullet_points from episode_outline where episode_id = %s order by start_ms nulls last, id",
+        (),
+        "_exec_episode_outline",
+    ),
+    (
+        "delete from episode_summary where episode_id = %s and created_by in (%s, %s)",
+        (),
+        "_exec_delete_episode_summaries",
+    ),
+    ("with latest_grade as", ("where c.episode_id = %s",), "_exec_episode_claims"),
+    ("with latest_grade as", ("where c.topic = %s",), "_exec_topic_claims"),
+    ("with latest_grade as", ("where c.id = %s",), "_exec_claim_detail"),
+    (
+        "select id, normalized_text from claim where episode_id = %s order by id",
+        (),
+        "_exec_episode_claim_texts",
+    ),
+    ("select es.id, es.title", ("from claim_evidence",), "_exec_claim_evidence"),
+    ("delete from claim where id = %s", (), "_exec_delete_claim"),
+    ("update claim set raw_text = %s", (), "_exec_update_claim"),
+    (
+        "select id, title, published_at from episode where title ilike %s",
+        (),
+        "_exec_search_episodes",
+    ),
+    (
+        "with latest_grade as",
+        (
+            "from claim c",
+            "where c.raw_text ilike %s or c.normalized_text ilike %s or c.topic ilike %s",
+        ),
+        "_exec_search_claims",
+    ),
+    (
+        "select id, raw_text, topic from claim where raw_text ilike %s",
+        (),
+        "_exec_search_claim_text",
+    ),
+    (
+        "select grade from claim_grade where claim_id = %s order by created_at desc limit 1",
+        (),
+        "_exec_latest_grade_value",
+    ),
+    (
+        "select id, episode_id, text, word_count from transcript where episode_id = %s",
+        (),
+        "_exec_episode_transcript",
+    ),
+    (
+        "select count(*), min(source_hash) from transcript_chunk where transcript_id = %s",
+        (),
+        "_exec_chunk_summary",
+    ),
+    (
+        "select count(*) from transcript_chunk where transcript_id = %s",
+        (),
+        "_exec_chunk_count",
+    ),
+    ("delete from transcript_chunk where transcript_id = %s", (), "_exec_delete_chunks"),
+    (
+        "update transcript_chunk set key_points = %s where id = %s",
+        (),
+        "_exec_update_chunk_key_points",
+    ),
+    (
+        "select id, transcript_id, chunk_index, token_start, token_end, token_count, text, key_points",
+        ("from transcript_chunk",),
+        "_exec_transcript_chunks",
+    ),
+    ("select id from evidence_source where pubmed_id = %s", (), "_exec_evidence_by_pubmed"),
+    ("select id from evidence_source where doi = %s", (), "_exec_evidence_by_doi"),
+    (
+        "select stance, notes from claim_evidence where claim_id = %s and evidence_id = %s",
+        (),
+        "_exec_claim_evidence_link",
+    ),
+    (
+        "select count(*) from claim_evidence where claim_id = %s and stance is not null",
+        (),
+        "_exec_claim_stance_count",
+    ),
+    (
+        "update claim_evidence set stance = %s, notes = %s where claim_id = %s and evidence_id = %s",
+        (),
+        "_exec_update_claim_evidence",
+    ),
+    ("update evidence_source set", (), "_exec_update_evidence_source"),
+    *(
+        route
+        for prefix in _JOB_SELECT_PREFIXES
+        for route in (
+            (prefix, ("from job_queue",), "_exec_select_job_queue"),
+            (prefix, ("from job",), "_exec_select_job"),
+        )
+    ),
+    (
+        "update job_queue set status = %s, started_at = now() where id = %s",
+        (),
+        "_exec_mark_job_started",
+    ),
+    (
+        "update job_queue set status = %s, finished_at = now(), error = null",
+        (),
+        "_exec_mark_job_finished",
+    ),
+    (
+        "update job_queue set status = %s, finished_at = now(), error = %s",
+        (),
+        "_exec_mark_job_failed",
+    ),
+    ("update job_queue set status = %s, run_at = %s", ("error = %s",), "_exec_requeue_job"),
+    (
+        "update job_queue set payload_json = coalesce(payload_json, '{}'::jsonb) || %s::jsonb where id = %s",
+        (),
+        "_exec_merge_job_payload",
+    ),
+    (
+        "update job_queue set result = %s, updated_at = now() where id = %s",
+        (),
+        "_exec_set_job_result",
+    ),
+)
+
+_PREFIX_ROUTES: Dict[str, Tuple[Tuple[str, Tuple[str, ...], str], ...]] = {}
+for _route_entry in _ROUTES:
+    _verb = _route_entry[0].partition(" ")[0]
+    _PREFIX_ROUTES[_verb] = _PREFIX_ROUTES.get(_verb, ()) + (_route_entry,)
+del _route_entry, _verb
 
 
-@dataclass
 class FakeCursor:
-    db: "FakeDatabase"
-    _rows: List[Tuple[Any, ...]] | None = None
-    _index: int = 0
+    __slots__ = ("db", "_rows", "_index", "_count", "_owner")
+
+    def __init__(self, db: "FakeDatabase", owner: Any = None) -> None:
+        self.db = db
+        self._rows: List[Tuple[Any, ...]] = []
+        self._index = 0
+        self._count = 0
+        # Whoever handed out this cursor; it gets the cursor back on __exit__
+        # once every row has been read.
+        self._owner = owner
 
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> None:
-        self._rows = self.db.execute(sql, params or ())
+        self._rows = rows = self.db.execute(sql, params or ())
         self._index = 0
+        self._count = len(rows)
 
     def fetchone(self) -> Tuple[Any, ...] | None:
-        if not self._rows:
-            return None
-        if self._index >= len(self._rows):
+        index = self._index
+        if index >= self._count:
             return None
-        row = self._rows[self._index]
-        self._index += 1
-        return row
+        self._index = index + 1
+        return self._rows[index]
 
     def fetchall(self) -> List[Tuple[Any, ...]]:
-        if not self._rows:
-            return []
-        if self._index == 0:
-            self._index = len(self._rows)
-            return list(self._rows)
-        remaining = self._rows[self._index :]
-        self._index = len(self._rows)
-        return list(remaining)
+        # Handlers build a fresh list per execute, so it can be handed over
+        # as-is once the cursor forgets it.
+        rows = self._rows
+        if self._index:
+            rows = rows[self._index :]
+        self._rows = []
+        self._index = self._count = 0
+        return rows
 
     def __enter__(self) -> "FakeCursor":
         return self
 
+    def _reset(self) -> None:
+        self._rows = []
+        self._index = self._count = 0
+
     def __exit__(self, exc_type, exc, tb) -> bool:
+        # Rows left unread stay readable after the block, so only a drained
+        # cursor goes back to its owner, which resets it when handing it out.
+        if self._owner is not None and self._index >= self._count:
+            self._owner._idle_cursor = self
         return False
 
 
 class FakeConnection:
     def __init__(self, db: "FakeDatabase") -> None:
         self._db = db
+        self._idle_cursor: FakeCursor | None = None
 
     def cursor(self) -> FakeCursor:
-        return FakeCursor(self._db)
+        # Reuse the cursor released by the last ``with`` block, if any; cursors
+        # still held open get their own instance as with a real connection.
+        cur = self._idle_cursor
+        if cur is None:
+            return FakeCursor(self._db, self)
+        self._idle_cursor = None
+        cur._reset()
+        return cur
 
     def close(self) -> None:  # pragma: no cover - compatibility shim
         return None
@@ -244,803 +911,707 @@ class FakeDatabase:
             "job": 1,
             "job_queue": 1,
         }
-        self._insert_order = 0
         self._clock = 0
+        self._pk: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        self._indexes: Dict[str, Dict[str, Dict[Any, List[Dict[str, Any]]]]] = {}
+        # Which list object (and how many of its rows) each table's indexes
+        # reflect.  Deletes rebind the list and tests append rows directly, so
+        # a mismatch triggers a rebuild on the next lookup.
+        self._indexed_rows: Dict[str, Tuple[List[Dict[str, Any]] | None, int]] = {}
+        self._latest_grades: Dict[Any, Dict[str, Any]] = {}
+        self._latest_summaries: Dict[Any, Dict[str, Any]] = {}
+        # status -> heap of (_queue_run_order key, push seq, row). A status or
+        # run_at change pushes a fresh entry; older entries for that job are
+        # skipped lazily because _queue_live holds only its latest seq, keyed
+        # by id(row) so that rows sharing a job id are tracked separately.
+        self._queue_heaps: Dict[Any, List[Tuple[Tuple[Any, ...], int, Dict[str, Any]]]] = {}
+        self._queue_live: Dict[int, int] = {}
+        self._queue_seq = 0
+        self._stance_counts: Dict[Any, int] = {}
+        # (claim_id, evidence_id) -> first claim_evidence row for that pair.
+        self._evidence_links: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        # episode id -> (published_at nulls last, newest first, highest id first).
+        self._episode_sort_keys: Dict[Any, Tuple[int, float, int]] = {}
+        # episode id -> grade-independent columns of its claim listing, in id
+        # order. Dropped whenever that episode gains a claim or claims reindex.
+        self._episode_claim_prefixes: Dict[Any, List[Tuple[Any, ...]]] = {}
+        # (claims, their raw_text/normalized_text/topic laid out three per
+        # claim) for the claim search; built on the first search, extended on
+        # insert and dropped with the claim indexes.
+        self._claim_search: Tuple[List[Dict[str, Any]], List[str]] | None = None
+        # claim_id -> evidence links ordered by source year (newest first).
+        # Invalidated whenever evidence_source rows change, since years live there.
+        self._evidence_order: Dict[Any, List[Dict[str, Any]]] = {}
+        self._evidence_order_valid = False
+        # Whether each table's rows (and so every index list) are in id order.
+        self._id_ascending: Dict[str, bool] = {}
+        self._last_id: Dict[str, int] = {}
+        self._idle_cursor: FakeCursor | None = None
+        # (table, payload column) -> (rows list, rows indexed, payload writes seen,
+        # canonical payload JSON -> rows); see _payload_bucket.
+        self._payload_indexes: Dict[Tuple[str, str], Tuple[Any, int, int, Dict[str, List[Dict[str, Any]]]]] = {}
+        self._payload_writes = 0
 
     def cursor(self) -> FakeCursor:
-        return FakeCursor(self)
+        cur = self._idle_cursor
+        if cur is None:
+            return FakeCursor(self, self)
+        self._idle_cursor = None
+        cur._reset()
+        return cur
 
-    def execute(self, sql: str, params: Sequence[Any]) -> List[Tuple[Any, ...]]:
-        stripped = sql.strip()
-        normalized = _normalize_sql(stripped)
-        normalized_query = normalized
+    def bulk_insert(self, table: str, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert ``rows`` into ``table`` as one multi-row ``INSERT``, skipping SQL parsing."""
 
-        if normalized.startswith("insert into"):
-            returning_columns: List[str] | None = None
-            match = re.search(r"\breturning\b", stripped, re.IGNORECASE)
-            statement = stripped
-            if match:
-                returning_part = stripped[match.end() :].strip().rstrip(";")
-                statement = stripped[: match.start()].strip()
-                returning_columns = [col.strip() for col in returning_part.split(",") if col.strip()]
-            inserted = self._handle_insert(statement, params)
-            if returning_columns:
-                rows: List[Tuple[Any, ...]] = []
-                for row in inserted:
-                    rows.append(tuple(row.get(column) for column in returning_columns))
-                return rows
-            return []
+        now = self._tick()
+        return [self._insert_row(table, row, now) for row in rows]
 
-        if "from episode where id = %s" in normalized:
-            episode_id = params[0]
-            episode = self._find_one("episode", episode_id)
-            return [(episode["id"], episode["title"]) ] if episode else []
-
-        if "from episode_summary" in normalized and "limit 1" in normalized:
-            episode_id = params[0]
-            summaries = [r for r in self.tables["episode_summary"] if r["episode_id"] == episode_id]
-            summaries.sort(key=lambda r: r.get("created_at", 0), reverse=True)
-            if summaries:
-                top = summaries[0]
-                return [(top.get("tl_dr"), top.get("narrative"))]
-            return []
+    def execute(self, sql: str, params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        plan = _PLAN_CACHE.get(sql)
+        if plan is None:
+            plan = _plan_statement(sql)
+        return plan.handler(self, plan, params)
 
-        if normalized.startswith(
-            "select start_ms, end_ms, heading, bullet_points from episode_outline where episode_id = %s order by start_ms nulls last, id"
-        ):
-            episode_id = params[0]
-            rows = [
-                row
-                for row in self.tables["episode_outline"]
-                if row.get("episode_id") == episode_id
-            ]
-            rows.sort(
-                key=lambda row: (
-                    row.get("start_ms") is None,
-                    row.get("start_ms") if row.get("start_ms") is not None else 0,
-                    row.get("id", 0),
-                )
-            )
-            return [
-                (
-                    row.get("start_ms"),
-                    row.get("end_ms"),
-                    row.get("heading"),
-                    row.get("bullet_points"),
-                )
-                for row in rows
-            ]
+    # statement routing -------------------------------------------------------
 
-        if normalized.startswith("delete from episode_summary where episode_id = %s and created_by in (%s, %s)"):
-            episode_id, creator_a, creator_b = params
-            allowed = {creator_a, creator_b}
-            self.tables["episode_summary"] = [
-                row
-                for row in self.tables["episode_summary"]
-                if not (
-                    row.get("episode_id") == episode_id
-                    and row.get("created_by") in allowed
-                )
-            ]
-            return []
+    @staticmethod
+    def _route(normalized: str) -> "_Handler | None":
+        """Return the handler for ``normalized`` SQL, or ``None`` if unsupported."""
 
-        if normalized.startswith("with latest_grade as") and "where c.episode_id = %s" in normalized:
-            return self._select_episode_claims(params[0])
+        if normalized.startswith("insert into"):
+            return FakeDatabase._exec_insert
 
-        if normalized.startswith("with latest_grade as") and "where c.topic = %s" in normalized:
-            return self._select_topic_claims(params[0])
+        for needles, name in _ANY_VERB_ROUTES:
+            if all(needle in normalized for needle in needles):
+                return getattr(FakeDatabase, name)
 
-        if normalized.startswith("with latest_grade as") and "where c.id = %s" in normalized:
-            return self._select_claim_detail(params[0])
+        name = _EXACT_ROUTES.get(normalized)
+        if name is not None:
+            return getattr(FakeDatabase, name)
 
-        if normalized == "select id, episode_id from claim order by id":
-            rows = sorted(self.tables["claim"], key=lambda r: r.get("id", 0))
-            return [
-                (row.get("id"), row.get("episode_id"))
-                for row in rows
-            ]
+        verb = normalized.partition(" ")[0]
+        for prefix, needles, name in _PREFIX_ROUTES.get(verb, ()):
+            if normalized.startswith(prefix) and all(needle in normalized for needle in needles):
+                return getattr(FakeDatabase, name)
+        return None
 
-        if normalized.startswith(
-            "select id, normalized_text from claim where episode_id = %s order by id"
-        ):
-            episode_id = params[0]
-            rows = [
-                (row.get("id"), row.get("normalized_text"))
-                for row in sorted(
-                    self.tables["claim"],
-                    key=lambda r: r.get("id", 0),
-                )
-                if row.get("episode_id") == episode_id
-            ]
-            return rows
+    # statement handlers ------------------------------------------------------
 
-        if normalized.startswith("select es.id, es.title") and "from claim_evidence" in normalized:
-            return self._select_claim_evidence(params[0])
+    def _exec_unsupported(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        raise ValueError(f"Unsupported SQL for fake db: {plan.sql}")
 
-        if normalized.startswith("delete from claim where id = %s"):
-            claim_id = params[0]
-            self.tables["claim"] = [
-                row for row in self.tables["claim"] if row.get("id") != claim_id
-            ]
-            return []
+    def _exec_insert(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        statement, returning_columns = _split_returning(plan.stripped)
+        inserted = self._handle_insert(statement, params)
+        if returning_columns:
+            return _project(inserted, returning_columns)
+        return []
 
-        if normalized.startswith("update claim set raw_text = %s"):
-            (
-                raw_text,
-                normalized_text,
-                topic,
-                domain,
-                risk_level,
-                start_ms,
-                end_ms,
-                claim_id,
-            ) = params
-            row = self._find_one("claim", claim_id)
-            if not row:
-                return []
-            row.update(
-                {
-                    "raw_text": raw_text,
-                    "normalized_text": normalized_text,
-                    "topic": topic,
-                    "domain": domain,
-                    "risk_level": risk_level,
-                    "start_ms": start_ms,
-                    "end_ms": end_ms,
-                }
-            )
-            row["updated_at"] = self._tick()
+    def _exec_episode_title(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        episode_id = params[0]
+        episode = self._find_one("episode", episode_id)
+        return [(episode["id"], episode["title"]) ] if episode else []
+
+    def _exec_latest_summary(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        self._ensure_indexes("episode_summary")
+        top = self._latest_summaries.get(params[0])
+        if top is None:
             return []
+        return [(top.get("tl_dr"), top.get("narrative"))]
 
-        if normalized.startswith("select id, title, published_at from episode where title ilike %s"):
-            pattern = params[0]
-            matches = [
-                episode
-                for episode in self.tables["episode"]
-                if _ilike_match(episode.get("title", ""), pattern)
-            ]
+    def _exec_episode_outline(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        return _project(
+            self._rows_by("episode_outline", "episode_id", params[0]), _OUTLINE_COLUMNS
+        )
 
-            matches.sort(
-                key=lambda episode: (
-                    0 if episode.get("published_at") is not None else 1,
-                    -_coerce_sortable_date(episode.get("published_at")),
-                    -episode.get("id", 0),
-                )
+    def _exec_delete_episode_summaries(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        episode_id, creator_a, creator_b = params
+        allowed = {creator_a, creator_b}
+        self.tables["episode_summary"] = [
+            row
+            for row in self.tables["episode_summary"]
+            if not (
+                row.get("episode_id") == episode_id
+                and row.get("created_by") in allowed
             )
+        ]
+        return []
 
-            limited = matches[:20]
-            return [
-                (
-                    episode.get("id"),
-                    episode.get("title"),
-                    episode.get("published_at"),
-                )
-                for episode in limited
-            ]
+    def _exec_episode_claims(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        return self._select_episode_claims(params[0])
 
-        if (
-            normalized.startswith("with latest_grade as")
-            and "from claim c" in normalized
-            and "where c.raw_text ilike %s or c.normalized_text ilike %s or c.topic ilike %s"
-            in normalized
-        ):
-            return self._select_search_claims(params[0])
-
-        if normalized.startswith("select id, raw_text, topic from claim where raw_text ilike %s"):
-            pattern = params[0]
-            matches = [
-                claim
-                for claim in self.tables["claim"]
-                if _ilike_match(claim.get("raw_text", ""), pattern)
-            ]
+    def _exec_topic_claims(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        return self._select_topic_claims(params[0])
 
-        if normalized.startswith(
-            "select grade from claim_grade where claim_id = %s order by created_at desc limit 1"
-        ):
-            claim_id = params[0]
-            grades = [
-                row
-                for row in self.tables["claim_grade"]
-                if row.get("claim_id") == claim_id
-            ]
-            grades.sort(key=lambda row: row.get("created_at", 0), reverse=True)
-            if not grades:
-                return []
-            return [(grades[0].get("grade"),)]
+    def _exec_claim_detail(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        return self._select_claim_detail(params[0])
 
-            matches.sort(key=lambda claim: -claim.get("id", 0))
-            limited = matches[:20]
-            return [
-                (
-                    claim.get("id"),
-                    claim.get("raw_text"),
-                    claim.get("topic"),
-                )
-                for claim in limited
-            ]
+    def _exec_claim_ids(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        rows = self._in_id_order("claim", self.tables["claim"])
+        return [
+            (row.get("id"), row.get("episode_id"))
+            for row in rows
+        ]
 
-        if normalized.startswith(
-            "select id, episode_id, text, word_count from transcript where episode_id = %s"
-        ):
-            episode_id = params[0]
-            transcripts = [
-                row
-                for row in self.tables["transcript"]
-                if row.get("episode_id") == episode_id and row.get("text") not in (None, "")
-            ]
-            transcripts.sort(
-                key=lambda row: (
-                    row.get("word_count") is None,
-                    -(row.get("word_count") or 0),
-                    -row.get("id", 0),
-                )
+    def _exec_episode_claim_texts(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        episode_id = params[0]
+        rows = [
+            (row.get("id"), row.get("normalized_text"))
+            for row in self._in_id_order(
+                "claim", self._rows_by("claim", "episode_id", episode_id)
             )
-            if transcripts:
-                top = transcripts[0]
-                return [
-                    (
-                        top.get("id"),
-                        top.get("episode_id"),
-                        top.get("text"),
-                        top.get("word_count"),
-                    )
-                ]
+        ]
+        return rows
+
+    def _exec_claim_evidence(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        return self._select_claim_evidence(params[0])
+
+    def _exec_delete_claim(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        claim_id = params[0]
+        self.tables["claim"] = [
+            row for row in self.tables["claim"] if row.get("id") != claim_id
+        ]
+        return []
+
+    def _exec_update_claim(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        (
+            raw_text,
+            normalized_text,
+            topic,
+            domain,
+            risk_level,
+            start_ms,
+            end_ms,
+            claim_id,
+        ) = params
+        row = self._find_one("claim", claim_id)
+        if not row:
             return []
+        row.update(
+            {
+                "raw_text": raw_text,
+                "normalized_text": normalized_text,
+                "topic": topic,
+                "domain": domain,
+                "risk_level": risk_level,
+                "start_ms": start_ms,
+                "end_ms": end_ms,
+            }
+        )
+        row["updated_at"] = self._tick()
+        self._invalidate_indexes("claim")
+        return []
 
-        if normalized.startswith(
-            "select count(*), min(source_hash) from transcript_chunk where transcript_id = %s"
-        ):
-            transcript_id = params[0]
-            rows = [
-                row
-                for row in self.tables["transcript_chunk"]
-                if row.get("transcript_id") == transcript_id
-            ]
-            count = len(rows)
-            hashes = [row.get("source_hash") for row in rows if row.get("source_hash")]
-            stored_hash = hashes[0] if hashes else None
-            return [(count, stored_hash)]
+    def _exec_search_episodes(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        pattern = params[0]
+        self._ensure_indexes("episode")
+        sort_keys = self._episode_sort_keys
+        matches = _ilike_filter(self.tables["episode"], "title", pattern)
 
-        if normalized.startswith(
-            "select count(*) from transcript_chunk where transcript_id = %s"
-        ):
-            transcript_id = params[0]
-            count = sum(
-                1
-                for row in self.tables["transcript_chunk"]
-                if row.get("transcript_id") == transcript_id
+        limited = heapq.nsmallest(20, matches, key=lambda episode: sort_keys[episode["id"]])
+        return [
+            (
+                episode.get("id"),
+                episode.get("title"),
+                episode.get("published_at"),
             )
-            return [(count,)]
+            for episode in limited
+        ]
 
-        if normalized.startswith("delete from transcript_chunk where transcript_id = %s"):
-            transcript_id = params[0]
-            self.tables["transcript_chunk"] = [
-                row
-                for row in self.tables["transcript_chunk"]
-                if row.get("transcript_id") != transcript_id
-            ]
-            return []
+    def _exec_search_claims(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        return self._select_search_claims(params[0])
 
-        if normalized.startswith("update transcript_chunk set key_points = %s where id = %s"):
-            key_points, chunk_id = params
-            row = self._find_one("transcript_chunk", chunk_id)
-            if not row:
-                return []
-            row["key_points"] = key_points
-            return []
+    def _exec_search_claim_text(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        pattern = params[0]
+        matches = _ilike_filter(self.tables["claim"], "raw_text", pattern)
+        # Highest ids first: the tail of the id-ordered matches, reversed.
+        limited = self._in_id_order("claim", matches)[-20:][::-1]
+        return [
+            (
+                claim.get("id"),
+                claim.get("raw_text"),
+                claim.get("topic"),
+            )
+            for claim in limited
+        ]
 
-        if normalized.startswith(
-            "select id, transcript_id, chunk_index, token_start, token_end, token_count, text, key_points"
-        ) and "from transcript_chunk" in normalized:
-            transcript_id = params[0]
-            rows = [
-                row
-                for row in self.tables["transcript_chunk"]
-                if row.get("transcript_id") == transcript_id
-            ]
-            rows.sort(key=lambda row: row.get("chunk_index", 0))
+    def _exec_latest_grade_value(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        latest = self._latest_grade(params[0])
+        return [(latest.get("grade"),)] if latest is not None else []
+
+    def _exec_episode_transcript(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        episode_id = params[0]
+        transcripts = [
+            row
+            for row in self._rows_by("transcript", "episode_id", episode_id)
+            if row.get("text") not in (None, "")
+        ]
+        if transcripts:
+            # min() keeps the first of equal keys, as the stable sort did.
+            top = min(transcripts, key=_transcript_rank)
             return [
                 (
-                    row.get("id"),
-                    row.get("transcript_id"),
-                    row.get("chunk_index"),
-                    row.get("token_start"),
-                    row.get("token_end"),
-                    row.get("token_count"),
-                    row.get("text"),
-                    row.get("key_points"),
-                    row.get("source_hash"),
+                    top.get("id"),
+                    top.get("episode_id"),
+                    top.get("text"),
+                    top.get("word_count"),
                 )
-                for row in rows
             ]
-
-        if normalized.startswith("select id from evidence_source where pubmed_id = %s"):
-            pubmed_id = params[0]
-            for row in self.tables["evidence_source"]:
-                if row.get("pubmed_id") == pubmed_id:
-                    return [(row.get("id"),)]
+        return []
+
+    def _exec_chunk_summary(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        transcript_id = params[0]
+        rows = self._rows_by("transcript_chunk", "transcript_id", transcript_id)
+        count = len(rows)
+        hashes = [row.get("source_hash") for row in rows if row.get("source_hash")]
+        stored_hash = hashes[0] if hashes else None
+        return [(count, stored_hash)]
+
+    def _exec_chunk_count(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        transcript_id = params[0]
+        return [(len(self._rows_by("transcript_chunk", "transcript_id", transcript_id)),)]
+
+    def _exec_delete_chunks(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        transcript_id = params[0]
+        self.tables["transcript_chunk"] = [
+            row
+            for row in self.tables["transcript_chunk"]
+            if row.get("transcript_id") != transcript_id
+        ]
+        return []
+
+    def _exec_update_chunk_key_points(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        key_points, chunk_id = params
+        row = self._find_one("transcript_chunk", chunk_id)
+        if not row:
             return []
+        row["key_points"] = key_points
+        return []
+
+    def _exec_transcript_chunks(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        transcript_id = params[0]
+        return _project(
+            self._rows_by("transcript_chunk", "transcript_id", transcript_id),
+            _CHUNK_COLUMNS,
+        )
 
-        if normalized.startswith("select id from evidence_source where doi = %s"):
-            doi = params[0]
-            for row in self.tables["evidence_source"]:
-                if row.get("doi") == doi:
-                    return [(row.get("id"),)]
+    def _exec_evidence_by_pubmed(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        for row in self._rows_by("evidence_source", "pubmed_id", params[0]):
+            return [(row.get("id"),)]
+        return []
+
+    def _exec_evidence_by_doi(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        for row in self._rows_by("evidence_source", "doi", params[0]):
+            return [(row.get("id"),)]
+        return []
+
+    def _exec_claim_evidence_link(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        self._ensure_indexes("claim_evidence")
+        row = self._evidence_links.get(tuple(params))
+        return [(row.get("stance"), row.get("notes"))] if row is not None else []
+
+    def _exec_claim_stance_count(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        self._ensure_indexes("claim_evidence")
+        return [(self._stance_counts.get(params[0], 0),)]
+
+    def _exec_update_claim_evidence(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        stance, notes, claim_id, evidence_id = params
+        self._ensure_indexes("claim_evidence")
+        row = self._evidence_links.get((claim_id, evidence_id))
+        if row is None:
             return []
-
-        if normalized.startswith(
-            "select stance, notes from claim_evidence where claim_id = %s and evidence_id = %s"
-        ):
-            claim_id, evidence_id = params
-            for row in self.tables["claim_evidence"]:
-                if row.get("claim_id") == claim_id and row.get("evidence_id") == evidence_id:
-                    return [(row.get("stance"), row.get("notes"))]
+        delta = (stance is not None) - (row.get("stance") is not None)
+        if delta:
+            self._stance_counts[claim_id] = self._stance_counts.get(claim_id, 0) + delta
+        row["stance"] = stance
+        row["notes"] = notes
+        return []
+
+    def _exec_update_evidence_source(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        evidence_id = params[-1]
+        row = self._find_one("evidence_source", evidence_id)
+        if not row:
             return []
+        row["title"] = params[0]
+        row["year"] = params[1]
+        identifier = params[2]
+        if identifier not in (None, ""):
+            row[_coalesced_identifier(plan.normalized)] = identifier
+        row["url"] = params[3]
+        row["type"] = params[4]
+        row["journal"] = params[5]
+        self._invalidate_indexes("evidence_source")
+        self._evidence_order_valid = False
+        return []
+
+    def _exec_select_job_queue(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        normalized = plan.normalized
+        clauses = _job_clauses(normalized)
+        column_names = _select_columns(normalized)
+
+        param_index = 0
+
+        # Bind the WHERE parameters in statement order first, so the starting
+        # rows can come from whichever index narrows them most.
+        if clauses & _WHERE_ID:
+            job_id = params[param_index]
+            param_index += 1
+
+        if clauses & (_WHERE_STATUS_DUE | _WHERE_STATUS):
+            status = params[param_index]
+            param_index += 1
+
+        if clauses & _JOB_TYPE_IN:
+            placeholder_count = _in_list_size(normalized, "job_type in (")
+            selected_types = [
+                params[param_index + offset] for offset in range(placeholder_count)
+            ]
+            param_index += placeholder_count
+            allowed_types = {str(job_type) for job_type in selected_types}
+        elif clauses & _JOB_TYPE_EQ:
+            job_type = params[param_index]
+            param_index += 1
+
+        payload_key = "payload_json" if clauses & _PAYLOAD_JSON else "payload"
+        filters_payload = clauses & (_PAYLOAD_JSONB_EQ | _PAYLOAD_EQ)
+        if filters_payload:
+            payload_filter = _json_param(params[param_index])
+            param_index += 1
+
+        limit_value: int | None = None
+        if clauses & _LIMIT_PARAM:
+            limit_value = int(params[param_index])
+            param_index += 1
+        elif clauses & _LIMIT_ONE:
+            limit_value = 1
+
+        offset_value = 0
+        if clauses & _OFFSET_PARAM:
+            offset_value = int(params[param_index])
+            param_index += 1
+
+        head = None if limit_value is None else offset_value + limit_value
 
-        if normalized.startswith(
-            "select count(*) from claim_evidence where claim_id = %s and stance is not null"
-        ):
-            claim_id = params[0]
-            count = sum(
-                1
-                for row in self.tables["claim_evidence"]
-                if row.get("claim_id") == claim_id and row.get("stance") is not None
-            )
-            return [(count,)]
-
-        if normalized.startswith(
-            "update claim_evidence set stance = %s, notes = %s where claim_id = %s and evidence_id = %s"
+        if (
+            head is not None
+            and clauses & _ORDER_PRIORITY_RUN_AT
+            and clauses & (_WHERE_STATUS_DUE | _WHERE_STATUS)
+            and not clauses & _WHERE_ID
+            and not filters_payload
         ):
-            stance, notes, claim_id, evidence_id = params
-            for row in self.tables["claim_evidence"]:
-                if row.get("claim_id") == claim_id and row.get("evidence_id") == evidence_id:
-                    row["stance"] = stance
-                    row["notes"] = notes
-                    break
-            return []
-
-        if normalized.startswith("update evidence_source set"):
-            evidence_id = params[-1]
-            row = self._find_one("evidence_source", evidence_id)
-            if not row:
-                return []
-            row["title"] = params[0]
-            row["year"] = params[1]
-            if "pubmed_id = coalesce" in normalized:
-                pubmed_id = params[2]
-                if pubmed_id not in (None, ""):
-                    row["pubmed_id"] = pubmed_id
-            else:
-                doi = params[2]
-                if doi not in (None, ""):
-                    row["doi"] = doi
-            row["url"] = params[3]
-            row["type"] = params[4]
-            row["journal"] = params[5]
-            return []
-
-
-        select_prefixes = (
-            "select id, job_type, payload, status, priority, run_at",
-            "select id, job_type, payload_json, status, priority, run_at",
-        )
-
-        if any(normalized.startswith(prefix) for prefix in select_prefixes) and "from job_queue" in normalized:
-            select_clause, _, _ = normalized.partition(" from ")
-            column_names = [
-                column.strip()
-                for column in select_clause[len("select ") :].split(",")
-                if column.strip()
-            ]
+            # The worker's dequeue poll: read the head of the status heap.
+            def _accepts(row: Dict[str, Any]) -> bool:
+                if clauses & _WHERE_STATUS_DUE and not self._job_due(row):
+                    return False
+                if clauses & _JOB_TYPE_IN:
+                    return row.get("job_type") in allowed_types
+                if clauses & _JOB_TYPE_EQ:
+                    return row.get("job_type") == job_type
+                return True
 
+            ordered = self._queue_head(status, head, _accepts)
+            return _project(ordered[offset_value:], column_names)
 
+        if clauses & _WHERE_ID:
+            row = self._find_one("job_queue", job_id)
+            rows = [row] if row else []
+        elif filters_payload:
+            rows = self._payload_bucket("job_queue", payload_key, payload_filter)
+        else:
             rows = [row for row in self.tables["job_queue"] if row is not None]
 
-            param_index = 0
-
-            def _is_due(row: Dict[str, Any]) -> bool:
-                run_at_value = row.get("run_at")
-                if run_at_value is None:
-                    return True
-                if isinstance(run_at_value, dt.datetime):
-                    if run_at_value.tzinfo is None:
-                        run_at_value = run_at_value.replace(tzinfo=dt.timezone.utc)
-                    return run_at_value <= dt.datetime.now(tz=dt.timezone.utc)
-                if isinstance(run_at_value, (int, float)):
-                    return float(run_at_value) <= float(self._clock)
-                return True
-
-            def _run_at_key(value: Any) -> float:
-                if value is None:
-                    return float("inf")
-                if isinstance(value, dt.datetime):
-                    if value.tzinfo is None:
-                        value = value.replace(tzinfo=dt.timezone.utc)
-                    return value.timestamp()
-                if isinstance(value, (int, float)):
-                    return float(value)
-                return float("inf")
-
-            if "where id = %s" in normalized:
-                job_id = params[param_index]
-                param_index += 1
-                row = self._find_one("job_queue", job_id)
-                rows = [row] if row else []
-
-            if "where status = %s and run_at <= now()" in normalized:
-                status = params[param_index]
-                param_index += 1
-                rows = [
-                    row
-                    for row in rows
-                    if row.get("status") == status and _is_due(row)
-                ]
-            elif "where status = %s" in normalized:
-                status = params[param_index]
-                param_index += 1
-                rows = [row for row in rows if row.get("status") == status]
-
-            if "job_type in (" in normalized:
-                placeholder_section = normalized.split("job_type in (", 1)[1].split(")", 1)[0]
-                placeholder_count = placeholder_section.count("%s")
-                selected_types = [
-                    params[param_index + offset] for offset in range(placeholder_count)
-                ]
-                param_index += placeholder_count
-                allowed_types = {str(job_type) for job_type in selected_types}
-                rows = [
-                    row
-                    for row in rows
-                    if str(row.get("job_type")) in allowed_types
-                ]
-            elif "job_type = %s" in normalized:
-                job_type = params[param_index]
-                param_index += 1
-                rows = [row for row in rows if row.get("job_type") == job_type]
-
-            payload_key = "payload_json" if "payload_json" in normalized else "payload"
-            if f"{payload_key}::jsonb = %s::jsonb" in normalized:
-                payload_value = params[param_index]
-                param_index += 1
-                if isinstance(payload_value, str):
-                    try:
-                        payload_filter = json.loads(payload_value)
-                    except json.JSONDecodeError:
-                        payload_filter = {}
-                else:
-                    payload_filter = payload_value
-                rows = [
-                    row for row in rows if row.get(payload_key) == payload_filter
-                ]
-            elif f"{payload_key} = %s" in normalized:
-                payload_value = params[param_index]
-                param_index += 1
-                if isinstance(payload_value, str):
-                    try:
-                        payload_filter = json.loads(payload_value)
-                    except json.JSONDecodeError:
-                        payload_filter = {}
-                else:
-                    payload_filter = payload_value
-                rows = [
-                    row for row in rows if row.get(payload_key) == payload_filter
-                ]
-
-            if "order by priority desc, run_at, id" in normalized:
-                rows.sort(
-                    key=lambda row: (
-                        -int(row.get("priority", 0) or 0),
-                        _run_at_key(row.get("run_at")),
-                        row.get("id", 0),
-                    )
-                )
-            elif "order by priority desc, id desc" in normalized:
-                rows.sort(
-                    key=lambda row: (
-                        -int(row.get("priority", 0) or 0),
-                        -row.get("id", 0),
-                    )
-                )
-            elif "order by id desc" in normalized:
-                rows.sort(key=lambda row: row.get("id", 0), reverse=True)
-
-            limit_value: int | None = None
-            if "limit %s" in normalized:
-                limit_value = int(params[param_index])
-                param_index += 1
-            elif "limit 1" in normalized:
-                limit_value = 1
-
-            offset_value = 0
-            if "offset %s" in normalized:
-                offset_value = int(params[param_index])
-                param_index += 1
-
-            if offset_value:
-                rows = rows[offset_value:]
-            if limit_value is not None:
-                rows = rows[:limit_value]
-
-            return [
-                tuple(row.get(column) for column in column_names)
+        if clauses & _WHERE_STATUS_DUE:
+            rows = [
+                row
                 for row in rows
+                if row.get("status") == status and self._job_due(row)
             ]
+        elif clauses & _WHERE_STATUS:
+            rows = [row for row in rows if row.get("status") == status]
 
-        job_select_prefixes = (
-            "select id, job_type, payload, status, priority, run_at",
-            "select id, job_type, payload_json, status, priority, run_at",
-        )
-
-        if any(normalized.startswith(prefix) for prefix in job_select_prefixes) and "from job" in normalized:
-            normalized_query = normalized
-            select_clause, _, _ = normalized_query.partition(" from ")
-            column_names = [
-                column.strip()
-                for column in select_clause[len("select ") :].split(",")
-                if column.strip()
+        if clauses & _JOB_TYPE_IN:
+            rows = [
+                row
+                for row in rows
+                if row.get("job_type") in allowed_types
             ]
+        elif clauses & _JOB_TYPE_EQ:
+            rows = [row for row in rows if row.get("job_type") == job_type]
 
+        if filters_payload:
+            rows = [
+                row for row in rows if row.get(payload_key) == payload_filter
+            ]
 
+        if clauses & _ORDER_PRIORITY_RUN_AT:
+            rows = _sorted_head(rows, _queue_run_order, head)
+        elif clauses & _ORDER_PRIORITY_ID_DESC:
+            rows = _sorted_head(rows, _queue_admin_order, head)
+        elif clauses & _ORDER_ID_DESC:
+            rows = _sorted_head(rows, _row_id, head, reverse=True)
+
+        if offset_value:
+            rows = rows[offset_value:]
+        if limit_value is not None:
+            rows = rows[:limit_value]
+
+        return _project(rows, column_names)
+
+    def _exec_select_job(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        normalized_query = plan.normalized
+        clauses = _job_clauses(normalized_query)
+        column_names = _select_columns(normalized_query)
+
+        # Every filter is an equality test, so collect them and make one pass
+        # over the table comparing all filtered columns at once.
+        filter_columns: List[str] = []
+        filter_values: List[Any] = []
+        param_index = 0
+
+        if clauses & _WHERE_STATUS:
+            filter_columns.append("status")
+            filter_values.append(params[param_index])
+            param_index += 1
+
+        if clauses & _WHERE_JOB_TYPE or clauses & _AND_JOB_TYPE:
+            filter_columns.append("job_type")
+            filter_values.append(params[param_index])
+            param_index += 1
+
+        if clauses & _WHERE_FINGERPRINT:
+            filter_columns.append("fingerprint")
+            filter_values.append(params[param_index])
+            param_index += 1
+        if clauses & _AND_FINGERPRINT:
+            filter_columns.append("fingerprint")
+            filter_values.append(params[param_index])
+            param_index += 1
+
+        payload_key = "payload_json" if clauses & _PAYLOAD_JSON else "payload"
+        if clauses & _PAYLOAD_EQ:
+            filter_columns.append(payload_key)
+            filter_values.append(_json_param(params[param_index]))
+            param_index += 1
+
+        if filter_columns:
+            wanted = tuple(filter_values)
+            source = (
+                self._payload_bucket("job", payload_key, filter_values[-1])
+                if clauses & _PAYLOAD_EQ
+                else self.tables["job"]
+            )
+            rows = [
+                row
+                for row in source
+                if row is not None and tuple(map(row.get, filter_columns)) == wanted
+            ]
+        else:
             rows = [row for row in self.tables["job"] if row is not None]
-            param_index = 0
-            normalized_query = normalized
-
-            if "where status = %s" in normalized_query:
-                status = params[param_index]
-                param_index += 1
-                rows = [row for row in rows if row.get("status") == status]
-
-
-            if "where job_type = %s" in normalized_query:
-
-                job_type = params[param_index]
-                param_index += 1
-                rows = [row for row in rows if row.get("job_type") == job_type]
-            elif "and job_type = %s" in normalized_query:
-                job_type = params[param_index]
-                param_index += 1
-                rows = [row for row in rows if row.get("job_type") == job_type]
-
-            if "where fingerprint = %s" in normalized_query:
-                fingerprint = params[param_index]
-                param_index += 1
-                rows = [
-                    row for row in rows if row.get("fingerprint") == fingerprint
-                ]
-            if "and fingerprint = %s" in normalized_query:
-                fingerprint = params[param_index]
-                param_index += 1
-                rows = [
-                    row for row in rows if row.get("fingerprint") == fingerprint
-                ]
-
-            payload_key = "payload_json" if "payload_json" in normalized_query else "payload"
-            if f"{payload_key} = %s" in normalized_query:
-                payload_value = params[param_index]
-                param_index += 1
-                if isinstance(payload_value, str):
-                    try:
-                        payload_filter = json.loads(payload_value)
-                    except json.JSONDecodeError:
-                        payload_filter = {}
-                else:
-                    payload_filter = payload_value
-                rows = [
-                    row for row in rows if row.get(payload_key) == payload_filter
-                ]
-
-            if "order by priority desc" in normalized_query:
-                rows.sort(
-                    key=lambda row: (
-                        row.get("priority") in (None, ""),
-                        -int(row.get("priority") or 0),
-                        -row.get("id", 0),
-                    )
-                )
-            else:
-                rows.sort(
-                    key=lambda row: row.get("id", 0),
-                    reverse="order by id desc" in normalized_query,
-                )
-
-            limit_value: int | None = None
-            if "limit %s" in normalized_query:
-                limit_value = int(params[param_index])
-                param_index += 1
-            elif "limit 1" in normalized_query:
-                limit_value = 1
-
-            offset_value = 0
-            if "offset %s" in normalized_query:
-                offset_value = int(params[param_index])
-                param_index += 1
-            else:
-                offset_value = None
-
-            if offset_value:
-                rows = rows[offset_value:]
-            if limit_value is not None:
-                rows = rows[:limit_value]
-
-            def _project_job(row: dict) -> tuple:
-                return tuple(row.get(column) for column in column_names)
-
-            return [_project_job(row) for row in rows]
-
-
-        if normalized.startswith(
-            "update job_queue set status = %s, started_at = now() where id = %s"
-        ):
-            status, job_id = params
-            row = self._find_one("job_queue", job_id)
-            if not row:
-                return []
-            row["status"] = status
-            row["started_at"] = self._tick()
-            row["next_run_at"] = None
-            row["updated_at"] = self._tick()
-            job_row = self._find_one("job", job_id)
-            if job_row:
-                job_row["status"] = row["status"]
-                job_row["started_at"] = row["started_at"]
-                job_row["updated_at"] = row["updated_at"]
-            return []
-
-        if normalized.startswith(
-            "update job_queue set status = %s, finished_at = now(), error = null"
-        ):
-            status, job_id = params
-            row = self._find_one("job_queue", job_id)
-            if not row:
-                return []
-            row["status"] = status
-            row["finished_at"] = self._tick()
-            row["error"] = None
-            row["last_error"] = None
-            row["updated_at"] = self._tick()
-            job_row = self._find_one("job", job_id)
-            if job_row:
-                job_row["status"] = row["status"]
-                job_row["finished_at"] = row["finished_at"]
-                job_row["error"] = None
-                job_row["last_error"] = None
-                job_row["updated_at"] = row["updated_at"]
-            return []
 
-        if normalized.startswith(
-            "update job_queue set status = %s, finished_at = now(), error = %s"
-        ):
-            status, error, job_id = params
-            row = self._find_one("job_queue", job_id)
-            if not row:
-                return []
-            row["status"] = status
-            row["finished_at"] = self._tick()
-            row["error"] = error
-            row["last_error"] = error
-            row["updated_at"] = self._tick()
-            job_row = self._find_one("job", job_id)
-            if job_row:
-                job_row["status"] = row["status"]
-                job_row["finished_at"] = row["finished_at"]
-                job_row["error"] = error
-                job_row["last_error"] = error
-                job_row["updated_at"] = row["updated_at"]
-            return []
-
-        if normalized.startswith(
-            "update job_queue set status = %s, run_at = %s"
-        ) and "error = %s" in normalized:
-            status = params[0]
-            run_at = params[1]
-            next_run_at = params[2]
-            error = params[3]
-            job_id = params[4]
-            row = self._find_one("job_queue", job_id)
-            if not row:
-                return []
-            row["status"] = status
-            row["run_at"] = run_at
-            row["next_run_at"] = next_run_at
-            row["error"] = error
-            row["last_error"] = error
-            row["started_at"] = None
-            row["finished_at"] = None
-            row["attempts"] = int(row.get("attempts", 0) or 0) + 1
-            row["updated_at"] = self._tick()
-            job_row = self._find_one("job", job_id)
-            if job_row:
-                job_row["status"] = row["status"]
-                job_row["run_at"] = run_at
-                job_row["next_run_at"] = next_run_at
-                job_row["error"] = error
-                job_row["last_error"] = error
-                job_row["started_at"] = None
-                job_row["finished_at"] = None
-                job_row["attempts"] = row["attempts"]
-                job_row["updated_at"] = row["updated_at"]
+        limit_value: int | None = None
+        if clauses & _LIMIT_PARAM:
+            limit_value = int(params[param_index])
+            param_index += 1
+        elif clauses & _LIMIT_ONE:
+            limit_value = 1
+
+        offset_value = 0
+        if clauses & _OFFSET_PARAM:
+            offset_value = int(params[param_index])
+            param_index += 1
+
+        head = None if limit_value is None else offset_value + limit_value
+        if clauses & _ORDER_PRIORITY:
+            rows = _sorted_head(rows, _job_priority_order, head)
+        else:
+            # Filtering kept table order, which is usually already id order.
+            rows = self._in_id_order("job", rows)
+            if clauses & _ORDER_ID_DESC:
+                rows = rows[::-1]
+
+        if offset_value:
+            rows = rows[offset_value:]
+        if limit_value is not None:
+            rows = rows[:limit_value]
+
+        return _project(rows, column_names)
+
+    def _exec_mark_job_started(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        status, job_id = params
+        row = self._find_one("job_queue", job_id)
+        if row:
+            now = self._tick()
+            self._update_job(
+                row,
+                {"status": status, "started_at": now, "next_run_at": None, "updated_at": now},
+            )
+        return []
+
+    def _exec_mark_job_finished(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        status, job_id = params
+        row = self._find_one("job_queue", job_id)
+        if row:
+            now = self._tick()
+            self._update_job(
+                row,
+                {
+                    "status": status,
+                    "finished_at": now,
+                    "updated_at": now,
+                    "error": None,
+                    "last_error": None,
+                },
+            )
+        return []
+
+    def _exec_mark_job_failed(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        status, error, job_id = params
+        row = self._find_one("job_queue", job_id)
+        if row:
+            now = self._tick()
+            self._update_job(
+                row,
+                {
+                    "status": status,
+                    "finished_at": now,
+                    "updated_at": now,
+                    "error": error,
+                    "last_error": error,
+                },
+            )
+        return []
+
+    def _exec_requeue_job(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        status, run_at, next_run_at, error, job_id = params[:5]
+        row = self._find_one("job_queue", job_id)
+        if row:
+            self._update_job(
+                row,
+                {
+                    "status": status,
+                    "run_at": run_at,
+                    "next_run_at": next_run_at,
+                    "error": error,
+                    "last_error": error,
+                    "started_at": None,
+                    "finished_at": None,
+                    "attempts": int(row.get("attempts", 0) or 0) + 1,
+                },
+            )
+        return []
+
+    def _exec_merge_job_payload(
+        self, plan: "_Plan", params: Sequence[Any]
+    ) -> List[Tuple[Any, ...]]:
+        payload_value, job_id = params
+        row = self._find_one("job_queue", job_id)
+        if not row:
             return []
-
-        if normalized.startswith(
-            "update job_queue set payload_json = coalesce(payload_json, '{}'::jsonb) || %s::jsonb where id = %s"
-        ):
-            payload_value, job_id = params
-            row = self._find_one("job_queue", job_id)
-            if not row:
-                return []
-            if isinstance(payload_value, str):
-                try:
-                    payload_update = json.loads(payload_value)
-                except json.JSONDecodeError:
-                    payload_update = {}
-            elif isinstance(payload_value, dict):
-                payload_update = dict(payload_value)
-            else:
+        if isinstance(payload_value, str):
+            try:
+                payload_update = json.loads(payload_value)
+            except json.JSONDecodeError:
                 payload_update = {}
-            existing = row.get("payload_json") or {}
-            if not isinstance(existing, dict):
-                existing = {}
-            if isinstance(payload_update, dict):
-                existing.update(payload_update)
-            row["payload_json"] = existing
-            row["payload"] = dict(existing)
-            row["updated_at"] = self._tick()
-            job_row = self._find_one("job", job_id)
-            if job_row:
-                job_row["payload"] = dict(existing)
-                job_row["payload_json"] = dict(existing)
-                job_row["updated_at"] = row["updated_at"]
+        elif isinstance(payload_value, dict):
+            payload_update = dict(payload_value)
+        else:
+            payload_update = {}
+        existing = row.get("payload_json")
+        # Copy on write: the old dict may still be shared with the job row or
+        # handed out by an earlier SELECT.
+        merged = dict(existing) if isinstance(existing, dict) else {}
+        if isinstance(payload_update, dict):
+            merged.update(payload_update)
+        row["payload_json"] = row["payload"] = merged
+        row["updated_at"] = self._tick()
+        self._payload_writes += 1
+        job_row = self._find_one("job", job_id)
+        if job_row:
+            job_row["payload_json"] = job_row["payload"] = merged
+            job_row["updated_at"] = row["updated_at"]
+        return []
+
+    def _exec_set_job_result(self, plan: "_Plan", params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        result_value, job_id = params
+        row = self._find_one("job_queue", job_id)
+        if not row:
             return []
-
-        if normalized.startswith(
-            "update job_queue set result = %s, updated_at = now() where id = %s"
-        ):
-            result_value, job_id = params
-            row = self._find_one("job_queue", job_id)
-            if not row:
-                return []
-            if isinstance(result_value, str):
-                try:
-                    row["result"] = json.loads(result_value)
-                except json.JSONDecodeError:
-                    row["result"] = result_value
-            else:
+        if isinstance(result_value, str):
+            try:
+                row["result"] = json.loads(result_value)
+            except json.JSONDecodeError:
                 row["result"] = result_value
-            row["updated_at"] = self._tick()
-            job_row = self._find_one("job", job_id)
-            if job_row:
-                job_row["result"] = row["result"]
-                job_row["updated_at"] = row["updated_at"]
-            return []
-
-        raise ValueError(f"Unsupported SQL for fake db: {sql}")
+        else:
+            row["result"] = result_value
+        row["updated_at"] = self._tick()
+        job_row = self._find_one("job", job_id)
+        if job_row:
+            job_row["result"] = row["result"]
+            job_row["updated_at"] = row["updated_at"]
+        return []
 
     # helpers -----------------------------------------------------------------
 
     def _handle_insert(self, sql: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
-        table, rows = parse_insert(sql)
-        param_iter = iter(params)
+        layout = _placeholder_insert(sql)
+        if layout is not None and len(params) >= len(layout[1]):
+            table, columns = layout
+            return [self._insert_row(table, dict(zip(columns, params)), self._tick())]
+
+        table, templates = _insert_template(sql)
+        # Every now() in one statement reads the same instant, as in Postgres.
+        now = self._tick()
+        param_index = 0
         inserted: List[Dict[str, Any]] = []
-        for row in rows:
-            materialized: Dict[str, Any] = {}
-            for key, value in row.items():
-                if isinstance(value, str) and "%s" in value:
-                    try:
-                        materialized[key] = next(param_iter)
-                    except StopIteration:
-                        materialized[key] = value
-                else:
-                    materialized[key] = value
-            inserted.append(self._insert_row(table, materialized))
+        for pairs, slots in templates:
+            materialized = dict(pairs)
+            if slots:
+                # Slots left over once params run out keep their literal text.
+                values = params[param_index : param_index + len(slots)]
+                param_index += len(values)
+                materialized.update(zip(slots, values))
+            inserted.append(self._insert_row(table, materialized, now))
         return inserted
 
-    def _insert_row(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
-        processed: Dict[str, Any] = {}
+    def _insert_row(self, table: str, row: Dict[str, Any], now: int) -> Dict[str, Any]:
+        """Insert one row; ``now`` is the statement's instant, shared by all its rows."""
+
+        # Column defaults first; supplied values overwrite them below.
+        processed: Dict[str, Any] = dict(_INSERT_DEFAULTS.get(table, ()))
         for key, value in row.items():
-            if value is NOW_SENTINEL:
-                processed[key] = self._tick()
-            else:
-                processed[key] = value
+            processed[key] = now if value is NOW_SENTINEL else value
 
         if table in self._auto_ids:
             if "id" not in processed or processed["id"] is None:
@@ -1049,19 +1620,18 @@ class FakeDatabase:
             else:
                 self._auto_ids[table] = max(self._auto_ids[table], int(processed["id"]) + 1)
 
-        processed.setdefault("__order", self._insert_order)
-        self._insert_order += 1
-
         if table in {"episode", "episode_summary", "claim", "claim_grade"}:
-            processed.setdefault("created_at", self._tick())
+            if "created_at" not in processed:
+                processed["created_at"] = now
 
-        if table == "claim_grade":
-            processed.setdefault("rubric_version", "v1")
-            processed.setdefault("graded_by", "auto-grader")
+        if table in ("job", "job_queue"):
+            # job_type is a text column; storing it as str lets the
+            # job_type IN (...) filter compare without coercing every row.
+            job_type = processed.get("job_type")
+            if job_type is not None and not isinstance(job_type, str):
+                processed["job_type"] = str(job_type)
 
         if table == "job_queue":
-            processed.setdefault("status", "queued")
-
             payload_value = processed.pop("payload_json", processed.get("payload"))
             if isinstance(payload_value, str):
                 try:
@@ -1073,24 +1643,19 @@ class FakeDatabase:
             else:
                 payload_dict = {}
 
-            processed["payload_json"] = payload_dict
-            processed["payload"] = dict(payload_dict)
+            # payload and payload_json are one column under two names; writers
+            # replace the dict rather than mutate it, so both can share it.
+            processed["payload_json"] = processed["payload"] = payload_dict
 
             processed["priority"] = int(processed.get("priority", 0) or 0)
             processed["attempts"] = int(processed.get("attempts", 0) or 0)
             processed["max_attempts"] = int(processed.get("max_attempts", 3) or 3)
-            processed.setdefault("run_at", None)
-            processed.setdefault("next_run_at", processed.get("run_at"))
-            processed.setdefault("error", None)
-            processed.setdefault("last_error", processed.get("error"))
-            processed.setdefault("created_at", self._tick())
-            processed.setdefault("started_at", None)
-            processed.setdefault("finished_at", None)
-
+            processed.setdefault("next_run_at", processed["run_at"])
+            processed.setdefault("last_error", processed["error"])
+            if "created_at" not in processed:
+                processed["created_at"] = now
 
         if table == "job":
-            processed.setdefault("status", "queued")
-
             payload_value = processed.get("payload")
             if isinstance(payload_value, str):
                 try:
@@ -1103,186 +1668,345 @@ class FakeDatabase:
             else:
                 processed.setdefault("payload", {})
 
-            processed.setdefault("payload_json", dict(processed.get("payload", {})))
-
-            processed.setdefault("priority", 0)
-            processed.setdefault("fingerprint", None)
-            processed.setdefault("run_at", None)
-            processed.setdefault("next_run_at", processed.get("run_at"))
-            processed.setdefault("attempts", 0)
-            processed.setdefault("max_attempts", 3)
-            processed.setdefault("last_error", None)
-            processed.setdefault("result", None)
-            processed.setdefault("error", None)
-            processed.setdefault("created_at", self._tick())
-            processed.setdefault("updated_at", processed.get("created_at"))
-
-            processed.setdefault("started_at", None)
-            processed.setdefault("finished_at", None)
-
-            queue_entry = {
-                "id": processed.get("id"),
-                "job_type": processed.get("job_type"),
-                "payload_json": processed.get("payload"),
-                "payload": processed.get("payload"),
-                "status": processed.get("status"),
-                "priority": processed.get("priority"),
-                "run_at": processed.get("run_at"),
-                "next_run_at": processed.get("next_run_at"),
-                "attempts": processed.get("attempts", 0),
-                "max_attempts": processed.get("max_attempts", 3),
-                "error": processed.get("error"),
-                "last_error": processed.get("last_error"),
-                "created_at": processed.get("created_at"),
-                "started_at": processed.get("started_at"),
-                "finished_at": processed.get("finished_at"),
-            }
-            self.tables["job_queue"].append(queue_entry)
+            processed.setdefault("payload_json", processed["payload"])
+            processed.setdefault("next_run_at", processed["run_at"])
+            if "created_at" not in processed:
+                processed["created_at"] = now
+            processed.setdefault("updated_at", processed["created_at"])
 
-        if table == "transcript_chunk":
-            processed.setdefault("key_points", None)
-            processed.setdefault("source_hash", None)
+            queue_entry = dict(
+                zip(_JOB_QUEUE_MIRROR_COLUMNS, map(processed.get, _JOB_MIRROR_SOURCES))
+            )
+            self._append_row("job_queue", queue_entry)
+            # The queue entry takes the job's id, so a later plain enqueue
+            # must not hand the same id out again.
+            if isinstance(queue_entry["id"], int):
+                self._auto_ids["job_queue"] = max(self._auto_ids["job_queue"], queue_entry["id"] + 1)
 
-        self.tables[table].append(processed)
+        self._append_row(table, processed)
         return processed
 
     def _tick(self) -> int:
         self._clock += 1
         return self._clock
 
+    def _append_row(self, table: str, row: Dict[str, Any]) -> None:
+        rows = self.tables[table]
+        in_sync = self._indexes_current(table)
+        rows.append(row)
+        if in_sync:
+            self._index_row(table, row)
+            self._indexed_rows[table] = (rows, len(rows))
+
+    def _indexes_current(self, table: str) -> bool:
+        rows = self.tables[table]
+        indexed_rows, indexed_count = self._indexed_rows.get(table, (None, 0))
+        return indexed_rows is rows and indexed_count == len(rows)
+
+    def _invalidate_indexes(self, table: str) -> None:
+        self._indexed_rows.pop(table, None)
+
+    def _index_row(self, table: str, row: Dict[str, Any]) -> None:
+        row_id = row.get("id")
+        self._pk[table].setdefault(row_id, row)
+        if not isinstance(row_id, int) or row_id < self._last_id.get(table, row_id):
+            self._id_ascending[table] = False
+        else:
+            self._last_id[table] = row_id
+        table_indexes = self._indexes[table]
+        position = _SORTED_BUCKETS.get(table)
+        for column in _INDEXED_COLUMNS.get(table, ()):
+            bucket = table_indexes[column].setdefault(row.get(column), [])
+            if position is not None:
+                bisect.insort(bucket, row, key=position)
+            else:
+                bucket.append(row)
+        if table == "episode":
+            published_at = row.get("published_at")
+            self._episode_sort_keys.setdefault(
+                row_id,
+                (
+                    0 if published_at is not None else 1,
+                    -_coerce_sortable_date(published_at),
+                    -(row_id or 0),
+                ),
+            )
+        if table == "claim":
+            self._episode_claim_prefixes.pop(row.get("episode_id"), None)
+            if self._claim_search is not None:
+                self._claim_search[0].append(row)
+                self._claim_search[1].extend(_claim_search_texts(row))
+        if table == "evidence_source":
+            self._evidence_order_valid = False
+        if table == "claim_evidence" and self._evidence_order_valid:
+            bisect.insort(
+                self._evidence_order.setdefault(row.get("claim_id"), []),
+                row,
+                key=self._evidence_year_key,
+            )
+        if table == "claim_evidence":
+            claim_id = row.get("claim_id")
+            self._evidence_links.setdefault((claim_id, row.get("evidence_id")), row)
+            if row.get("stance") is not None:
+                self._stance_counts[claim_id] = self._stance_counts.get(claim_id, 0) + 1
+        if table == "job_queue":
+            self._queue_push(row)
+        if table == "episode_summary":
+            # Ties on created_at keep the earlier insert, as a stable
+            # descending sort would.
+            episode_id = row.get("episode_id")
+            current = self._latest_summaries.get(episode_id)
+            if current is None or row.get("created_at", 0) > current.get("created_at", 0):
+                self._latest_summaries[episode_id] = row
+        if table == "claim_grade":
+            # Ties on created_at go to the later insert, matching a stable sort.
+            claim_id = row.get("claim_id")
+            current = self._latest_grades.get(claim_id)
+            if current is None or row.get("created_at", 0) >= current.get("created_at", 0):
+                self._latest_grades[claim_id] = row
+
+    def _ensure_indexes(self, table: str) -> None:
+        if self._indexes_current(table):
+            return
+        rows = self.tables[table]
+        self._pk[table] = {}
+        self._indexes[table] = {column: {} for column in _INDEXED_COLUMNS.get(table, ())}
+        self._id_ascending[table] = True
+        self._last_id.pop(table, None)
+        if table == "claim_grade":
+            self._latest_grades = {}
+        if table == "episode_summary":
+            self._latest_summaries = {}
+        if table == "job_queue":
+            self._queue_heaps = {}
+            self._queue_live = {}
+        if table == "claim_evidence":
+            self._stance_counts = {}
+            self._evidence_links = {}
+        if table == "episode":
+            self._episode_sort_keys = {}
+        if table == "claim":
+            self._episode_claim_prefixes = {}
+            self._claim_search = None
+        if table in ("claim_evidence", "evidence_source"):
+            self._evidence_order_valid = False
+        for row in rows:
+            if row is not None:
+                self._index_row(table, row)
+        self._indexed_rows[table] = (rows, len(rows))
+
+    def _rows_by(self, table: str, column: str, value: Any) -> List[Dict[str, Any]]:
+        self._ensure_indexes(table)
+        return self._indexes[table][column].get(value, [])
+
+    def _in_id_order(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return ``rows`` ordered by id, sorting only if inserts arrived out of order."""
+
+        self._ensure_indexes(table)
+        if self._id_ascending[table]:
+            return rows
+        return sorted(rows, key=_row_id)
+
     def _find_one(self, table: str, pk: int) -> Dict[str, Any] | None:
-        for row in self.tables[table]:
-            if row.get("id") == pk:
-                return row
-        return None
+        self._ensure_indexes(table)
+        return self._pk[table].get(pk)
+
+    def _update_job(self, row: Dict[str, Any], fields: Dict[str, Any]) -> None:
+        """Write ``fields`` to a job_queue row and its job mirror.
+
+        ``updated_at`` is stamped with a new tick unless the caller already
+        set it to the statement's now().
+        """
+
+        if "updated_at" not in fields:
+            fields["updated_at"] = self._tick()
+        row.update(fields)
+        job_row = self._find_one("job", row.get("id"))
+        if job_row:
+            job_row.update(fields)
+        self._queue_push(row)
+
+    def _queue_push(self, row: Dict[str, Any]) -> None:
+        self._queue_seq += 1
+        self._queue_live[id(row)] = self._queue_seq
+        heapq.heappush(
+            self._queue_heaps.setdefault(row.get("status"), []),
+            (_queue_run_order(row), self._queue_seq, row),
+        )
+
+    def _queue_head(
+        self, status: Any, count: int, accepts: Callable[[Dict[str, Any]], bool]
+    ) -> List[Dict[str, Any]]:
+        """First ``count`` accepted ``status`` jobs in ``_queue_run_order``.
+
+        Skipped entries are pushed back, so a poll costs the jobs it passes
+        over rather than a sort of the whole queue.
+        """
+
+        self._ensure_indexes("job_queue")
+        heap = self._queue_heaps.get(status)
+        if not heap:
+            return []
+        taken: List[Dict[str, Any]] = []
+        seen: List[Tuple[Tuple[Any, ...], int, Dict[str, Any]]] = []
+        while heap and len(taken) < count:
+            entry = heapq.heappop(heap)
+            row = entry[2]
+            if self._queue_live.get(id(row)) != entry[1]:
+                continue
+            seen.append(entry)
+            if accepts(row):
+                taken.append(row)
+        for entry in seen:
+            heapq.heappush(heap, entry)
+        return taken
+
+    def _job_due(self, row: Dict[str, Any]) -> bool:
+        run_at_value = row.get("run_at")
+        if run_at_value is None:
+            return True
+        if isinstance(run_at_value, dt.datetime):
+            if run_at_value.tzinfo is None:
+                run_at_value = run_at_value.replace(tzinfo=dt.timezone.utc)
+            return run_at_value <= dt.datetime.now(tz=dt.timezone.utc)
+        if isinstance(run_at_value, (int, float)):
+            return float(run_at_value) <= float(self._clock)
+        return True
+
+    def _payload_bucket(self, table: str, column: str, payload: Any) -> List[Dict[str, Any]]:
+        """Rows of ``table`` whose ``column`` has the same canonical JSON as ``payload``.
+
+        The index only narrows candidates; callers still compare with ``==``.
+        Appends extend it in place; a rebound table or a payload merge rebuilds it.
+        """
+
+        rows = self.tables[table]
+        cached = self._payload_indexes.get((table, column))
+        if (
+            cached is None
+            or cached[0] is not rows
+            or cached[1] > len(rows)
+            or cached[2] != self._payload_writes
+        ):
+            buckets: Dict[str, List[Dict[str, Any]]] = {}
+            start = 0
+        else:
+            _, start, _, buckets = cached
+        for row in rows[start:]:
+            if row is not None:
+                buckets.setdefault(_payload_signature(row.get(column)), []).append(row)
+        self._payload_indexes[(table, column)] = (rows, len(rows), self._payload_writes, buckets)
+        return buckets.get(_payload_signature(payload), [])
 
     def _latest_grade(self, claim_id: int) -> Dict[str, Any] | None:
-        grades = [g for g in self.tables["claim_grade"] if g["claim_id"] == claim_id]
-        grades.sort(key=lambda g: g.get("created_at", 0))
-        return grades[-1] if grades else None
+        self._ensure_indexes("claim_grade")
+        return self._latest_grades.get(claim_id)
 
     def _select_episode_claims(self, episode_id: int) -> List[Tuple[Any, ...]]:
-        claims = [c for c in self.tables["claim"] if c["episode_id"] == episode_id]
-        claims.sort(key=lambda c: c["id"])
-        rows: List[Tuple[Any, ...]] = []
-        for claim in claims:
-            latest = self._latest_grade(claim["id"])
-            rows.append(
+        self._ensure_indexes("claim")
+        prefixes = self._episode_claim_prefixes.get(episode_id)
+        if prefixes is None:
+            claims = self._in_id_order("claim", self._rows_by("claim", "episode_id", episode_id))
+            prefixes = _project(
+                claims,
                 (
-                    claim["id"],
-                    claim.get("raw_text"),
-                    claim.get("normalized_text"),
-                    claim.get("topic"),
-                    claim.get("domain"),
-                    claim.get("risk_level"),
-                    claim.get("start_ms"),
-                    claim.get("end_ms"),
-                    latest.get("grade") if latest else None,
-                    latest.get("rationale") if latest else None,
-                )
+                    "id",
+                    "raw_text",
+                    "normalized_text",
+                    "topic",
+                    "domain",
+                    "risk_level",
+                    "start_ms",
+                    "end_ms",
+                ),
             )
-        return rows
+            self._episode_claim_prefixes[episode_id] = prefixes
+        self._ensure_indexes("claim_grade")
+        latest_grades = self._latest_grades
+        return [
+            prefix
+            + (
+                _pick(latest, _GRADE_PAIR)
+                if (latest := latest_grades.get(prefix[0]))
+                else (None, None)
+            )
+            for prefix in prefixes
+        ]
 
     def _select_topic_claims(self, topic: str) -> List[Tuple[Any, ...]]:
-        claims = [c for c in self.tables["claim"] if c.get("topic") == topic]
-        entries: List[Tuple[int, Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = []
+        claims = self._rows_by("claim", "topic", topic)
+        self._ensure_indexes("episode")
+        episodes = self._pk["episode"]
+        sort_keys = self._episode_sort_keys
+        entries: List[Tuple[Tuple[int, float, int], Dict[str, Any], Dict[str, Any]]] = []
         for claim in claims:
-            episode = self._find_one("episode", claim["episode_id"])
+            episode = episodes.get(claim["episode_id"])
             if not episode:
                 continue
-            latest = self._latest_grade(claim["id"])
-            entries.append((claim["id"], claim, episode, latest))
-
-        def sort_key(item: Tuple[int, Dict[str, Any], Dict[str, Any], Dict[str, Any]]):
-            _, claim, episode, _ = item
-            published_at = episode.get("published_at")
-            # Nulls last when sorting desc -> treat None as smaller priority.
-            return (
-                0 if published_at is not None else 1,
-                -(published_at or 0),
-                -episode.get("id", 0),
-            )
+            entries.append((sort_keys[episode["id"]], claim, episode))
 
-        entries.sort(key=sort_key)
+        entries.sort(key=itemgetter(0))
 
         rows: List[Tuple[Any, ...]] = []
-        for claim_id, claim, episode, latest in entries:
+        for _, claim, episode in entries:
+            latest = self._latest_grade(claim["id"])
             rows.append(
-                (
-                    claim_id,
-                    episode["id"],
-                    episode.get("title"),
-                    claim.get("raw_text"),
-                    claim.get("normalized_text"),
-                    claim.get("domain"),
-                    claim.get("risk_level"),
-                    claim.get("start_ms"),
-                    claim.get("end_ms"),
-                    latest.get("grade") if latest else None,
-                    latest.get("rationale") if latest else None,
+                (claim["id"], episode["id"], episode.get("title"))
+                + _pick(
+                    claim,
+                    ("raw_text", "normalized_text", "domain", "risk_level", "start_ms", "end_ms"),
                 )
+                + (_pick(latest, _GRADE_PAIR) if latest else (None, None))
             )
         return rows
 
     def _select_search_claims(self, pattern: str) -> List[Tuple[Any, ...]]:
-        rows: List[Tuple[Any, ...]] = []
-        for claim in self.tables["claim"]:
-            raw_text = (claim.get("raw_text") or "")
-            normalized_text = (claim.get("normalized_text") or "")
-            topic = (claim.get("topic") or "")
-
-            if not (
-                _ilike_match(raw_text, pattern)
-                or _ilike_match(normalized_text, pattern)
-                or _ilike_match(topic, pattern)
-            ):
-                continue
-
-            episode = self._find_one("episode", claim.get("episode_id"))
+        if pattern is None:
+            return []
+        self._ensure_indexes("episode")
+        episodes = self._pk["episode"]
+        sort_keys = self._episode_sort_keys
+        self._ensure_indexes("claim")
+        if self._claim_search is None:
+            claims = [claim for claim in self.tables["claim"] if claim is not None]
+            haystack = [text for claim in claims for text in _claim_search_texts(claim)]
+            self._claim_search = (claims, haystack)
+        # Every claim's searchable columns are scanned as one batch; value i
+        # belongs to claim i // 3.
+        claims, haystack = self._claim_search
+        matched = dict.fromkeys(index // 3 for index in _ilike_indices(haystack, pattern))
+        entries: List[Tuple[Tuple[int, float, int], Dict[str, Any], Dict[str, Any]]] = []
+        for claim in map(claims.__getitem__, matched):
+            episode = episodes.get(claim.get("episode_id"))
             if not episode:
                 continue
+            # Newest episode first, then highest claim id within an episode.
+            published_rank, newest_first, _ = sort_keys[episode["id"]]
+            entries.append(
+                ((published_rank, newest_first, -int(claim.get("id") or 0)), claim, episode)
+            )
 
+        # Only the LIMIT 50 survivors get their grade looked up and a row built.
+        rows: List[Tuple[Any, ...]] = []
+        for _, claim, episode in heapq.nsmallest(50, entries, key=itemgetter(0)):
             latest = self._latest_grade(claim.get("id"))
             rows.append(
-                (
-                    claim.get("id"),
-                    claim.get("raw_text"),
-                    claim.get("normalized_text"),
-                    claim.get("topic"),
-                    claim.get("domain"),
-                    claim.get("risk_level"),
-                    claim.get("episode_id"),
-                    episode.get("title"),
-                    episode.get("published_at"),
-                    latest.get("grade") if latest else None,
-                    latest.get("rationale") if latest else None,
-                    latest.get("rubric_version") if latest else None,
-                    latest.get("created_at") if latest else None,
+                _pick(
+                    claim,
+                    (
+                        "id",
+                        "raw_text",
+                        "normalized_text",
+                        "topic",
+                        "domain",
+                        "risk_level",
+                        "episode_id",
+                    ),
                 )
+                + _pick(episode, ("title", "published_at"))
+                + (_pick(latest, _GRADE_COLUMNS) if latest else _NO_GRADE)
             )
-
-        def _sort_key(row: Tuple[Any, ...]) -> Tuple[int, float, int]:
-            published_at = row[8]
-            sort_value = 0.0
-            if isinstance(published_at, dt.datetime):
-                if published_at.tzinfo is None:
-                    published_at = published_at.replace(tzinfo=dt.timezone.utc)
-                sort_value = published_at.timestamp()
-            elif isinstance(published_at, (int, float)):
-                sort_value = float(published_at)
-            elif isinstance(published_at, str):
-                try:
-                    sort_value = dt.datetime.fromisoformat(published_at).timestamp()
-                except ValueError:
-                    sort_value = 0.0
-            return (
-                0 if published_at is not None else 1,
-                -sort_value,
-                -int(row[0] or 0),
-            )
-
-        rows.sort(key=_sort_key)
-        return rows[:50]
+        return rows
 
     def _select_claim_detail(self, claim_id: int) -> List[Tuple[Any, ...]]:
         claim = self._find_one("claim", claim_id)
@@ -1291,44 +2015,38 @@ class FakeDatabase:
         episode = self._find_one("episode", claim["episode_id"])
         latest = self._latest_grade(claim_id)
         return [
-            (
-                claim_id,
-                episode.get("title") if episode else None,
-                claim.get("topic"),
-                claim.get("domain"),
-                claim.get("risk_level"),
-                claim.get("raw_text"),
-                claim.get("normalized_text"),
-                latest.get("grade") if latest else None,
-                latest.get("rationale") if latest else None,
-                latest.get("rubric_version") if latest else None,
-                latest.get("created_at") if latest else None,
-            )
+            (claim_id, episode.get("title") if episode else None)
+            + _pick(claim, ("topic", "domain", "risk_level", "raw_text", "normalized_text"))
+            + (_pick(latest, _GRADE_COLUMNS) if latest else _NO_GRADE)
         ]
 
+    def _evidence_year_key(self, link: Dict[str, Any]) -> Tuple[bool, Any]:
+        evidence = self._find_one("evidence_source", link.get("evidence_id"))
+        year = evidence.get("year") if evidence else None
+        return (year is None, -(year or 0))
+
     def _select_claim_evidence(self, claim_id: int) -> List[Tuple[Any, ...]]:
+        self._ensure_indexes("evidence_source")
+        self._ensure_indexes("claim_evidence")
+        if not self._evidence_order_valid:
+            self._evidence_order = {
+                key: sorted(links, key=self._evidence_year_key)
+                for key, links in self._indexes["claim_evidence"]["claim_id"].items()
+            }
+            self._evidence_order_valid = True
+
         rows: List[Tuple[Any, ...]] = []
-        for link in self.tables["claim_evidence"]:
-            if link["claim_id"] != claim_id:
-                continue
+        for link in self._evidence_order.get(claim_id, ()):
             evidence = self._find_one("evidence_source", link["evidence_id"])
             if not evidence:
                 continue
             rows.append(
-                (
-                    evidence.get("id"),
-                    evidence.get("title"),
-                    evidence.get("year"),
-                    evidence.get("type"),
-                    evidence.get("journal"),
-                    evidence.get("doi"),
-                    evidence.get("pubmed_id"),
-                    evidence.get("url"),
-                    link.get("stance"),
+                _pick(
+                    evidence,
+                    ("id", "title", "year", "type", "journal", "doi", "pubmed_id", "url"),
                 )
+                + (link.get("stance"),)
             )
-
-        rows.sort(key=lambda r: (r[2] is None, -(r[2] or 0)))
         return rows
 
 
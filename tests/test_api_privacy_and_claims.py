@@ -25,9 +25,26 @@ TRANSCRIPT_TEXT_BY_EPISODE = {
     3: "Episode 3 transcript mentions SECRET_MAGNESIUM",
 }
 
-ADDITIONAL_EPISODE_SQL = [
-    "INSERT INTO episode (id, podcast_id, title) VALUES (2, 1, 'Metabolic Morning Show 002');",
-    "INSERT INTO episode (id, podcast_id, title) VALUES (3, 1, 'Brain and Body Chat 015');",
+ADDITIONAL_EPISODES = [
+    {"id": 2, "podcast_id": 1, "title": "Metabolic Morning Show 002"},
+    {"id": 3, "podcast_id": 1, "title": "Brain and Body Chat 015"},
+]
+
+EPISODE_OUTLINE = [
+    {
+        "episode_id": 1,
+        "start_ms": 0,
+        "end_ms": 90000,
+        "heading": "Foundations",
+        "bullet_points": "- Safe protocols\n- Benefits overview",
+    },
+    {
+        "episode_id": 1,
+        "start_ms": 90000,
+        "end_ms": 180000,
+        "heading": "Protocol deep dive",
+        "bullet_points": "• Scheduling cold exposure\n• Contrast showers",
+    },
 ]
 
 
@@ -89,33 +106,15 @@ def seeded_client(fake_db: FakeDatabase) -> Iterable[TestClient]:
             cur = conn.cursor()
             for stmt in statements:
                 cur.execute(stmt)
-            for stmt in ADDITIONAL_EPISODE_SQL:
-                cur.execute(stmt)
-            for episode_id, transcript_text in TRANSCRIPT_TEXT_BY_EPISODE.items():
-                cur.execute(
-                    "INSERT INTO transcript (episode_id, source, lang, text) VALUES (%s, %s, %s, %s)",
-                    (episode_id, "upload", "en", transcript_text),
-                )
-            cur.execute(
-                "INSERT INTO episode_outline (episode_id, start_ms, end_ms, heading, bullet_points) VALUES (%s, %s, %s, %s, %s)",
-                (
-                    1,
-                    0,
-                    90000,
-                    "Foundations",
-                    "- Safe protocols\n- Benefits overview",
-                ),
-            )
-            cur.execute(
-                "INSERT INTO episode_outline (episode_id, start_ms, end_ms, heading, bullet_points) VALUES (%s, %s, %s, %s, %s)",
-                (
-                    1,
-                    90000,
-                    180000,
-                    "Protocol deep dive",
-                    "• Scheduling cold exposure\n• Contrast showers",
-                ),
-            )
+        fake_db.bulk_insert("episode", ADDITIONAL_EPISODES)
+        fake_db.bulk_insert(
+            "transcript",
+            (
+                {"episode_id": episode_id, "source": "upload", "lang": "en", "text": transcript_text}
+                for episode_id, transcript_text in TRANSCRIPT_TEXT_BY_EPISODE.items()
+            ),
+        )
+        fake_db.bulk_insert("episode_outline", EPISODE_OUTLINE)
         yield client
 
 
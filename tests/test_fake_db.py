@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import pytest
+
+from .fake_db import (
+    NOW_SENTINEL,
+    FakeConnection,
+    FakeDatabase,
+    _compile_ilike,
+    _ilike_filter,
+    _ilike_match,
+    parse_insert,
+)
+
+
+@pytest.fixture
+def db() -> FakeDatabase:
+    return FakeDatabase()
+
+
+@pytest.fixture
+def conn(db: FakeDatabase) -> FakeConnection:
+    return FakeConnection(db)
+
+
+def test_parse_insert_handles_quoted_delimiters_and_literals() -> None:
+    table, rows = parse_insert(
+        "INSERT INTO claim (id, raw_text, topic, created_at) VALUES "
+        "(1, 'It''s fine, (mostly); really', NULL, now()), "
+        "(2, %s, 'sleep', -3);"
+    )
+
+    assert table == "claim"
+    assert rows == [
+        {"id": 1, "raw_text": "It's fine, (mostly); really", "topic": None, "created_at": NOW_SENTINEL},
+        {"id": 2, "raw_text": "%s", "topic": "sleep", "created_at": -3},
+    ]
+
+
+def test_parse_insert_stops_at_statement_terminator() -> None:
+    _, rows = parse_insert("INSERT INTO podcast (title) VALUES ('A'); INSERT INTO podcast (title) VALUES ('B')")
+
+    assert rows == [{"title": "A"}]
+
+
+def test_claim_listing_sorts_ids_inserted_out_of_order(db: FakeDatabase) -> None:
+    db.execute("INSERT INTO claim (id, episode_id, normalized_text) VALUES (5, 1, 'b')", ())
+    db.execute("INSERT INTO claim (id, episode_id, normalized_text) VALUES (2, 1, 'a')", ())
+
+    assert db.execute("SELECT id, episode_id FROM claim ORDER BY id", ()) == [(2, 1), (5, 1)]
+    assert db.execute(
+        "SELECT id, normalized_text FROM claim WHERE episode_id = %s ORDER BY id", (1,)
+    ) == [(2, "a"), (5, "b")]
+
+
+def test_claim_evidence_order_tracks_evidence_year_changes(db: FakeDatabase) -> None:
+    db.execute("INSERT INTO claim_evidence (claim_id, evidence_id, stance) VALUES (1, 1, 'supports')", ())
+    db.execute("INSERT INTO claim_evidence (claim_id, evidence_id, stance) VALUES (1, 2, 'refutes')", ())
+    db.execute("INSERT INTO evidence_source (id, title, year) VALUES (1, 'Old', 2001)", ())
+    db.execute("INSERT INTO evidence_source (id, title, year) VALUES (2, 'Undated', NULL)", ())
+
+    query = (
+        "SELECT es.id, es.title, es.year, es.type, es.journal, es.doi, es.pubmed_id, es.url, ce.stance "
+        "FROM claim_evidence ce JOIN evidence_source es ON es.id = ce.evidence_id "
+        "WHERE ce.claim_id = %s ORDER BY es.year DESC NULLS LAST"
+    )
+    assert [row[0] for row in db.execute(query, (1,))] == [1, 2]
+
+    db.execute(
+        "UPDATE evidence_source SET title = %s, year = %s, doi = COALESCE(%s, doi), url = %s, type = %s, journal = %s WHERE id = %s",
+        ("Undated", 2020, None, None, None, None, 2),
+    )
+    assert [row[0] for row in db.execute(query, (1,))] == [2, 1]
+
+
+def test_claim_evidence_link_updates_track_stance_counts(db: FakeDatabase) -> None:
+    db.bulk_insert(
+        "claim_evidence",
+        [
+            {"claim_id": 1, "evidence_id": 7, "stance": None, "notes": None},
+            {"claim_id": 1, "evidence_id": 8, "stance": "supports", "notes": "n"},
+        ],
+    )
+    link_sql = "SELECT stance, notes FROM claim_evidence WHERE claim_id = %s AND evidence_id = %s"
+    count_sql = "SELECT COUNT(*) FROM claim_evidence WHERE claim_id = %s AND stance IS NOT NULL"
+
+    assert db.execute(link_sql, (1, 8)) == [("supports", "n")]
+    assert db.execute(link_sql, (2, 8)) == []
+    db.execute(
+        "UPDATE claim_evidence SET stance = %s, notes = %s WHERE claim_id = %s AND evidence_id = %s",
+        ("refutes", "why", 1, 7),
+    )
+    assert db.execute(link_sql, (1, 7)) == [("refutes", "why")]
+    assert db.execute(count_sql, (1,)) == [(2,)]
+
+
+def test_connection_reuses_released_cursor_only(conn: FakeConnection) -> None:
+    with conn.cursor() as first:
+        first.execute("INSERT INTO podcast (title) VALUES (%s) RETURNING id", ("A",))
+        with conn.cursor() as nested:
+            assert nested is not first
+            nested.execute("INSERT INTO podcast (title) VALUES (%s) RETURNING id", ("B",))
+            assert nested.fetchone() == (2,)
+        assert first.fetchone() == (1,)
+
+    with conn.cursor() as again:
+        assert again is first
+        assert again.fetchone() is None
+
+
+def test_cursor_rows_stay_readable_after_with_block(conn: FakeConnection) -> None:
+    with conn.cursor() as cur:
+        cur.execute("INSERT INTO claim (episode_id, raw_text) VALUES (7, 'a'), (7, 'b') RETURNING id", ())
+        fetched = cur.fetchall()
+    with conn.cursor() as unread:
+        unread.execute("SELECT id, episode_id FROM claim ORDER BY id", ())
+
+    with conn.cursor() as other:
+        assert other is not unread
+        other.execute("INSERT INTO podcast (title) VALUES (%s) RETURNING id", ("C",))
+
+    assert fetched == [(1,), (2,)]
+    assert unread.fetchall() == [(1, 7), (2, 7)]
+
+
+def test_episode_claim_listing_reflects_claim_updates(db: FakeDatabase) -> None:
+    db.execute("INSERT INTO claim (id, episode_id, raw_text) VALUES (1, 7, 'before')", ())
+    query = (
+        "WITH latest_grade AS (SELECT DISTINCT ON (claim_id) claim_id, grade, rationale, created_at "
+        "FROM claim_grade ORDER BY claim_id, created_at DESC) "
+        "SELECT c.id, c.raw_text, c.normalized_text, c.topic, c.domain, c.risk_level, c.start_ms, c.end_ms, "
+        "lg.grade, lg.rationale FROM claim c LEFT JOIN latest_grade lg ON lg.claim_id = c.id "
+        "WHERE c.episode_id = %s ORDER BY c.start_ms NULLS LAST, c.id"
+    )
+    assert [row[1] for row in db.execute(query, (7,))] == ["before"]
+
+    db.execute(
+        "UPDATE claim SET raw_text = %s, normalized_text = %s, topic = %s, domain = %s, "
+        "risk_level = %s, start_ms = %s, end_ms = %s WHERE id = %s",
+        ("after", "after", None, None, None, None, None, 1),
+    )
+    db.execute("INSERT INTO claim (id, episode_id, raw_text) VALUES (2, 7, 'new')", ())
+    db.execute("INSERT INTO claim_grade (claim_id, grade, rationale) VALUES (1, 'moderate', 'ok')", ())
+
+    rows = db.execute(query, (7,))
+    assert [row[1] for row in rows] == ["after", "new"]
+    assert rows[0][8:] == ("moderate", "ok")
+
+
+def test_now_is_one_instant_per_statement(db: FakeDatabase) -> None:
+    db.execute(
+        "INSERT INTO claim_grade (claim_id, grade, created_at, updated_at) VALUES (%s, %s, now(), now())",
+        (1, "A"),
+    )
+    db.execute(
+        "INSERT INTO job_queue (job_type, payload_json, run_at) VALUES (%s, %s, now())",
+        ("summarize", "{}"),
+    )
+    db.execute("UPDATE job_queue SET status = %s, started_at = now() WHERE id = %s", ("running", 1))
+
+    grade = db.tables["claim_grade"][0]
+    job = db.tables["job_queue"][0]
+    assert grade["created_at"] == grade["updated_at"]
+    assert job["created_at"] == job["run_at"]
+    assert job["started_at"] == job["updated_at"] > job["run_at"]
+
+
+def test_now_is_shared_by_every_row_of_a_statement(db: FakeDatabase) -> None:
+    db.execute(
+        "INSERT INTO claim (episode_id, raw_text, created_at) VALUES (1, 'a', now()), (1, 'b', now())",
+        (),
+    )
+    db.bulk_insert("claim", [{"episode_id": 2, "raw_text": "c"}, {"episode_id": 2, "raw_text": "d"}])
+
+    first, second, third, fourth = (row["created_at"] for row in db.tables["claim"])
+    assert first == second
+    assert third == fourth > second
+
+
+def test_job_listing_limit_matches_full_sort(db: FakeDatabase) -> None:
+    for priority in (1, 3, 2, 3, 1, 2, 3, 0, 2, 1, 3, 0):
+        db.execute(
+            "INSERT INTO job (job_type, payload, priority) VALUES (%s, %s, %s)",
+            ("summarize", "{}", priority),
+        )
+
+    query = (
+        "SELECT id, job_type, payload, status, priority, run_at FROM job "
+        "ORDER BY priority DESC, id DESC LIMIT %s OFFSET %s"
+    )
+    rows = db.execute(query, (2, 1))
+    assert [(row[0], row[4]) for row in rows] == [(7, 3), (4, 3)]
+
+    newest = db.execute(
+        "SELECT id, job_type, payload, status, priority, run_at FROM job ORDER BY id DESC LIMIT %s", (2,)
+    )
+    assert [row[0] for row in newest] == [12, 11]
+
+
+SEARCH_CLAIMS_SQL = (
+    "WITH latest_grade AS (SELECT DISTINCT ON (claim_id) claim_id, grade, rationale, rubric_version, created_at "
+    "FROM claim_grade ORDER BY claim_id, created_at DESC) "
+    "SELECT c.id, c.raw_text, c.normalized_text, c.topic, c.domain, c.risk_level, c.episode_id, e.title, "
+    "e.published_at, lg.grade, lg.rationale, lg.rubric_version, lg.created_at "
+    "FROM claim c JOIN episode e ON e.id = c.episode_id LEFT JOIN latest_grade lg ON lg.claim_id = c.id "
+    "WHERE c.raw_text ILIKE %s OR c.normalized_text ILIKE %s OR c.topic ILIKE %s "
+    "ORDER BY e.published_at DESC NULLS LAST, c.id DESC LIMIT 50"
+)
+
+
+def test_search_claims_orders_by_episode_date_then_claim_id(db: FakeDatabase) -> None:
+    db.execute("INSERT INTO episode (id, title, published_at) VALUES (1, 'Old', 100)", ())
+    db.execute("INSERT INTO episode (id, title, published_at) VALUES (2, 'New', 200)", ())
+    db.execute("INSERT INTO episode (id, title, published_at) VALUES (3, 'Undated', NULL)", ())
+    for claim_id, episode_id in ((1, 3), (2, 1), (3, 2), (4, 1), (5, 2)):
+        db.execute(
+            "INSERT INTO claim (id, episode_id, raw_text) VALUES (%s, %s, %s)",
+            (claim_id, episode_id, "Ketones help"),
+        )
+    db.execute("INSERT INTO claim (id, episode_id, raw_text) VALUES (6, 2, 'Unrelated')", ())
+
+    rows = db.execute(SEARCH_CLAIMS_SQL, ("%ketone%",) * 3)
+
+    assert [row[0] for row in rows] == [5, 3, 4, 2, 1]
+
+
+def test_search_claims_sees_inserted_and_updated_claims(db: FakeDatabase) -> None:
+    db.bulk_insert("episode", [{"id": 1, "title": "E", "published_at": 100}])
+    db.bulk_insert("claim", [{"id": 1, "episode_id": 1, "raw_text": "ketones"}])
+    assert [row[0] for row in db.execute(SEARCH_CLAIMS_SQL, ("%ketone%",) * 3)] == [1]
+
+    db.bulk_insert("claim", [{"id": 2, "episode_id": 1, "topic": "Ketone diets"}])
+    db.execute(
+        "UPDATE claim SET raw_text = %s, normalized_text = %s, topic = %s, domain = %s, "
+        "risk_level = %s, start_ms = %s, end_ms = %s WHERE id = %s",
+        ("sleep", None, None, None, None, None, None, 1),
+    )
+
+    assert [row[0] for row in db.execute(SEARCH_CLAIMS_SQL, ("%ketone%",) * 3)] == [2]
+    assert [row[0] for row in db.execute(SEARCH_CLAIMS_SQL, ("sleep",) * 3)] == [1]
+
+
+def test_search_claims_keeps_first_fifty_in_order(db: FakeDatabase) -> None:
+    db.bulk_insert("episode", [{"id": 1, "title": "A", "published_at": 100}, {"id": 2, "title": "B"}])
+    db.bulk_insert(
+        "claim",
+        [{"episode_id": 1 + index % 2, "raw_text": f"ketones {index}"} for index in range(80)],
+    )
+
+    rows = db.execute(SEARCH_CLAIMS_SQL, ("%ketones%",) * 3)
+
+    dated = [claim_id for claim_id in range(80, 0, -1) if claim_id % 2]
+    undated = [claim_id for claim_id in range(80, 0, -1) if not claim_id % 2]
+    assert [row[0] for row in rows] == (dated + undated)[:50]
+
+
+@pytest.mark.parametrize("pattern", ["%sleep%", "sleep", "%p_hygiene", "sl%ne"])
+def test_search_claims_matches_any_text_column(db: FakeDatabase, pattern: str) -> None:
+    db.bulk_insert("episode", [{"id": 1, "title": "E", "published_at": 100}])
+    db.bulk_insert(
+        "claim",
+        [
+            {"id": 1, "episode_id": 1, "raw_text": "Sleep", "normalized_text": None, "topic": None},
+            {"id": 2, "episode_id": 1, "raw_text": "x", "normalized_text": "sleep", "topic": "sleep"},
+            {"id": 3, "episode_id": 1, "raw_text": "x", "normalized_text": "y", "topic": "sleep_hygiene"},
+            {"id": 4, "episode_id": 1, "raw_text": "asleep", "normalized_text": "y", "topic": "z"},
+        ],
+    )
+
+    rows = db.execute(SEARCH_CLAIMS_SQL, (pattern,) * 3)
+
+    expected = [
+        claim["id"]
+        for claim in reversed(db.tables["claim"])
+        if any(
+            _ilike_match(claim[column] or "", pattern)
+            for column in ("raw_text", "normalized_text", "topic")
+        )
+    ]
+    assert expected
+    assert [row[0] for row in rows] == expected
+
+
+def test_bulk_insert_matches_sql_inserts(db: FakeDatabase) -> None:
+    inserted = db.bulk_insert(
+        "claim",
+        [
+            {"episode_id": 1, "normalized_text": "a", "created_at": NOW_SENTINEL},
+            {"episode_id": 1, "normalized_text": "b"},
+        ],
+    )
+
+    assert [row["id"] for row in inserted] == [1, 2]
+    assert inserted[0]["created_at"] is not NOW_SENTINEL
+    assert db.execute(
+        "SELECT id, normalized_text FROM claim WHERE episode_id = %s ORDER BY id", (1,)
+    ) == [(1, "a"), (2, "b")]
+
+
+def test_transcript_chunks_list_in_chunk_index_order(db: FakeDatabase) -> None:
+    db.bulk_insert(
+        "transcript_chunk",
+        [
+            {"transcript_id": 1, "chunk_index": 2, "text": "c"},
+            {"transcript_id": 2, "chunk_index": 0, "text": "other"},
+            {"transcript_id": 1, "chunk_index": 0, "text": "a"},
+        ],
+    )
+    query = (
+        "SELECT id, transcript_id, chunk_index, token_start, token_end, token_count, text, "
+        "key_points, source_hash FROM transcript_chunk WHERE transcript_id = %s ORDER BY chunk_index"
+    )
+    assert [row[6] for row in db.execute(query, (1,))] == ["a", "c"]
+
+    db.bulk_insert("transcript_chunk", [{"transcript_id": 1, "chunk_index": 1, "text": "b"}])
+    assert [row[6] for row in db.execute(query, (1,))] == ["a", "b", "c"]
+
+
+def test_latest_summary_prefers_newest_then_first_inserted(db: FakeDatabase) -> None:
+    db.bulk_insert(
+        "episode_summary",
+        [
+            {"episode_id": 1, "tl_dr": "old", "narrative": "", "created_at": 1},
+            {"episode_id": 1, "tl_dr": "new", "narrative": "", "created_at": 5},
+            {"episode_id": 1, "tl_dr": "tie", "narrative": "", "created_at": 5},
+        ],
+    )
+    query = (
+        "SELECT tl_dr, narrative FROM episode_summary WHERE episode_id = %s "
+        "ORDER BY created_at DESC LIMIT 1"
+    )
+    assert db.execute(query, (1,)) == [("new", "")]
+    assert db.execute(query, (2,)) == []
+
+
+@pytest.mark.parametrize("pattern", ["%", "", "a%", "%b%", "_", "a_c", "%a%b%", "100%"])
+def test_ilike_filter_agrees_with_row_by_row_match(pattern: str) -> None:
+    rows = [{"title": value} for value in ("", "abc", "ABC", "a\nb", None, "ab", "100%", "abcabc")]
+
+    expected = [row for row in rows if _ilike_match(row["title"], pattern)]
+
+    assert _ilike_filter(rows, "title", pattern) == expected
+
+
+@pytest.mark.parametrize("pattern", ["%ketones help%", "Ketones_help", "%KETONES%HELP%", "%\nmore lines%"])
+def test_ilike_filter_agrees_on_large_scans(pattern: str) -> None:
+    texts = ["ketones help", "Ketones help", "ketones-help", "ketones help\nmore lines", "", "other", "ketones"]
+    rows = [{"raw_text": f"{texts[index % len(texts)]}"} for index in range(300)]
+
+    expected = [row for row in rows if _ilike_match(row["raw_text"], pattern)]
+
+    assert expected
+    assert _ilike_filter(rows, "raw_text", pattern) == expected
+
+
+@pytest.mark.parametrize("pattern", ["%KET%", "ket%", "%help", "ketones", "%%ones%%", "%-%"])
+def test_literal_ilike_patterns_agree_with_regex(pattern: str) -> None:
+    texts = ["ketones help", "Ketones HELP", "ketones-help", "a\nketones", "", "KETONES"]
+
+    for text in texts:
+        assert _ilike_match(text, pattern) == (_compile_ilike(pattern).fullmatch(text) is not None)
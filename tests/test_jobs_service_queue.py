@@ -151,3 +151,200 @@ def test_update_job_progress_records_payload() -> None:
     assert progress["current_chunk"] == 1
     assert progress["percent_complete"] == pytest.approx(0.4)
     assert progress.get("message") == "Processing"
+
+
+def test_row_to_job_converts_timestamptz_columns_to_utc() -> None:
+    class _Cursor:
+        description = [
+            (name, 1184 if name in jobs_service._TIMESTAMP_COLUMNS else 25)
+            for name in jobs_service._JOB_COLUMNS
+        ]
+
+    assert jobs_service._cursor_tz_aware(_Cursor()) is True
+    assert jobs_service._cursor_tz_aware(object()) is False
+
+    created = dt.datetime(2024, 1, 1, 2, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+    row = (1, "summarize", "{}", "queued", 0, None, None, 0, 3, None, created, None, None)
+    job = jobs_service._row_to_job(row, tz_aware=True)
+
+    assert job.created_at == created and job.created_at.tzinfo == jobs_service.UTC
+    assert job.run_at == job.created_at
+
+
+class _DescribedCursor:
+    """Cursor stub that returns one job row under a fixed column description."""
+
+    def __init__(self, row: tuple, type_code: int) -> None:
+        self._row = row
+        self.description = [(name, type_code) for name in jobs_service._JOB_COLUMNS]
+
+    def __enter__(self) -> "_DescribedCursor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: tuple) -> None:
+        return None
+
+    def fetchone(self) -> tuple:
+        return self._row
+
+
+class _DescribedConnection:
+    def __init__(self, cursor: _DescribedCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _DescribedCursor:
+        return self._cursor
+
+
+def test_job_timestamps_are_utc_whichever_cursor_came_first() -> None:
+    offset = dt.timezone(dt.timedelta(hours=2))
+    aware = dt.datetime(2024, 1, 1, 14, 0, tzinfo=offset)
+    naive = dt.datetime(2024, 1, 1, 12, 0)
+    expected = dt.datetime(2024, 1, 1, 12, 0, tzinfo=dt.timezone.utc)
+
+    def job_row(stamp: dt.datetime) -> tuple:
+        return (1, "summarize", "{}", "queued", 0, stamp, stamp, 0, 3, None, stamp, None, None)
+
+    tz_cursor = _DescribedCursor(job_row(aware), jobs_service._TIMESTAMPTZ_OID)
+    plain_cursor = _DescribedCursor(job_row(naive), 1114)
+
+    from_tz = jobs_service.get_job(_DescribedConnection(tz_cursor), 1)
+    from_plain = jobs_service.get_job(_DescribedConnection(plain_cursor), 1)
+
+    assert from_tz is not None and from_plain is not None
+    for job in (from_tz, from_plain):
+        assert job.run_at == expected and job.run_at.tzinfo == dt.timezone.utc
+        assert job.created_at is not None and job.created_at.tzinfo == dt.timezone.utc
+
+
+def test_find_job_by_payload_returns_newest_match() -> None:
+    db = FakeDatabase()
+
+    with FakeConnection(db) as conn:
+        jobs_service.enqueue_job(conn, job_type="summarize", payload={"episode_id": 1})
+        newest = jobs_service.enqueue_job(conn, job_type="summarize", payload={"episode_id": 1})
+        jobs_service.enqueue_job(conn, job_type="summarize", payload={"episode_id": 2})
+
+    with FakeConnection(db) as conn:
+        found = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 1}
+        )
+        missing = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 3}
+        )
+
+    assert found is not None
+    assert found.id == newest.id
+    assert missing is None
+
+
+def test_find_job_by_payload_tracks_progress_updates() -> None:
+    db = FakeDatabase()
+
+    with FakeConnection(db) as conn:
+        job = jobs_service.enqueue_job(conn, job_type="summarize", payload={"episode_id": 1})
+        assert jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 1}
+        )
+        jobs_service.update_job_progress(conn, job.id, total_chunks=2, completed_chunks=1)
+        stale = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 1}
+        )
+        updated = jobs_service.get_job(conn, job.id)
+        assert updated is not None
+        current = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload=updated.payload
+        )
+        later = jobs_service.enqueue_job(conn, job_type="summarize", payload={"episode_id": 1})
+        newest = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 1}
+        )
+
+    assert stale is None
+    assert current is not None and current.id == job.id
+    assert newest is not None and newest.id == later.id
+
+
+def test_find_job_by_payload_treats_equal_numbers_as_equal() -> None:
+    db = FakeDatabase()
+
+    with FakeConnection(db) as conn:
+        job = jobs_service.enqueue_job(
+            conn, job_type="summarize", payload={"episode_id": 1.0, "chunks": [2, 3.5]}
+        )
+        found = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 1, "chunks": [2.0, 3.5]}
+        )
+        missing = jobs_service.find_job_by_payload(
+            conn, job_type="summarize", payload={"episode_id": 1.5, "chunks": [2, 3.5]}
+        )
+
+    assert found is not None and found.id == job.id
+    assert missing is None
+
+
+def test_dequeue_follows_priority_types_and_requeues() -> None:
+    db = FakeDatabase()
+
+    with FakeConnection(db) as conn:
+        low = jobs_service.enqueue_job(conn, job_type="alpha", priority=0)
+        high = jobs_service.enqueue_job(conn, job_type="alpha", priority=5)
+        other = jobs_service.enqueue_job(conn, job_type="beta", priority=9)
+        mid = jobs_service.enqueue_job(conn, job_type="alpha", priority=3)
+
+        first = jobs_service.dequeue_job(conn, ("alpha",))
+        assert first is not None and first.id == high.id
+        jobs_service.mark_job_failed(conn, first, "boom", backoff_seconds=0)
+
+        # The failed job is queued again but not due for a while yet.
+        second = jobs_service.dequeue_job(conn, ("alpha",))
+        assert second is not None and second.id == mid.id
+
+        third = jobs_service.dequeue_job(conn)
+        fourth = jobs_service.dequeue_job(conn)
+        assert fourth is not None
+        jobs_service.mark_job_done(conn, fourth.id)
+        finished = jobs_service.list_jobs(conn, status="finished", limit=5)
+
+    assert third is not None and third.id == other.id
+    assert fourth.id == low.id
+    assert [job.id for job in finished] == [low.id]
+
+
+def test_job_insert_then_enqueue_keeps_ids_unique_and_job_row_synced() -> None:
+    db = FakeDatabase()
+
+    with FakeConnection(db) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO job (job_type, payload, priority) VALUES (%s, %s, %s)",
+                ("alpha", '{"episode_id": 1}', 2),
+            )
+        queued = jobs_service.enqueue_job(conn, job_type="beta", payload={"episode_id": 2})
+        jobs_service.mark_job_done(conn, 1)
+
+    queue_ids = [row["id"] for row in db.tables["job_queue"]]
+    assert queued.id == 2
+    assert sorted(queue_ids) == [1, 2]
+    job_row = db.tables["job"][0]
+    assert job_row["id"] == 1
+    assert job_row["status"] == "finished"
+    assert job_row["finished_at"] == db.tables["job_queue"][0]["finished_at"]
+
+
+def test_limited_queue_poll_keeps_rows_that_share_an_id() -> None:
+    db = FakeDatabase()
+    db.execute("INSERT INTO job_queue (id, job_type, priority) VALUES (1, 'alpha', 1)", ())
+    db.execute("INSERT INTO job_queue (id, job_type, priority) VALUES (1, 'beta', 0)", ())
+
+    with FakeConnection(db) as conn:
+        limited = jobs_service.list_jobs(conn, status="queued", limit=10)
+        full = jobs_service.list_jobs(conn, status="queued")
+        alpha = jobs_service.dequeue_job(conn, ["alpha"])
+
+    assert [(job.id, job.job_type) for job in limited] == [(job.id, job.job_type) for job in full]
+    assert [job.job_type for job in limited] == ["alpha", "beta"]
+    assert alpha is not None and alpha.job_type == "alpha"
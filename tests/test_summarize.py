@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from server.services import summarize
+
+
+@pytest.fixture
+def stub_blingfire(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    stub = SimpleNamespace(
+        text_to_sentences=lambda text: "First one.\n \nSecond one!\n",
+        text_to_words=lambda text: "First , one .",
+    )
+    monkeypatch.setattr(summarize, "blingfire", stub)
+    return stub
+
+
+def test_fast_tokenizer_is_opt_in(stub_blingfire: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(summarize.FAST_TOKENIZER_ENV, raising=False)
+    assert summarize._fast_tokenizer_enabled() is False
+
+    monkeypatch.setenv(summarize.FAST_TOKENIZER_ENV, "1")
+    assert summarize._fast_tokenizer_enabled() is True
+
+    monkeypatch.setattr(summarize, "blingfire", None)
+    assert summarize._fast_tokenizer_enabled() is False
+
+
+def test_fast_tokenizer_follows_sumy_contract(stub_blingfire: SimpleNamespace) -> None:
+    tokenizer = summarize._get_tokenizer("english", fast=True)
+
+    assert isinstance(tokenizer, summarize._FastTokenizer)
+    assert tokenizer.language == "english"
+    assert tokenizer.to_sentences("First one. Second one!") == ("First one.", "Second one!")
+    assert tokenizer.to_words("First, one.") == ("First", "one")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import server.ui as ui
+
+
+def test_fast_json_registers_orjson_loader_on_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[object, object]] = []
+    fake_orjson = SimpleNamespace(loads=lambda data: {"decoded": data})
+    monkeypatch.setattr(ui, "orjson", fake_orjson)
+    monkeypatch.setattr(ui, "set_json_loads", lambda loads, context: calls.append((loads, context)))
+    cursor = object()
+
+    ui._use_fast_json(cursor)
+
+    assert calls == [(fake_orjson.loads, cursor)]
+
+
+def test_fast_json_is_skipped_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+    monkeypatch.setattr(ui, "orjson", None)
+    monkeypatch.setattr(ui, "set_json_loads", lambda loads, context: calls.append(context))
+
+    ui._use_fast_json(object())
+
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ("published_at", "label"),
+    [
+        ("2024-03-05T23:30:00-05:00", "March 05, 2024"),
+        ("2024-03-05", "March 05, 2024"),
+        (None, None),
+        ("not a date", None),
+    ],
+)
+def test_published_label_is_formatted_in_python(published_at: str | None, label: str | None) -> None:
+    episode = ui._with_published_label({"id": 1, "published_at": published_at})
+
+    assert episode["published_label"] == label